@@ -0,0 +1,8 @@
+# manifest.py — freeze config into a custom MicroPython firmware image.
+# Build from the MicroPython tree, e.g.:
+#   make -C ports/rp2 BOARD=RPI_PICO2_W FROZEN_MANIFEST=<repo>/manifest.py
+# Frozen modules run straight from flash: no parse/compile at boot and no
+# heap used for their bytecode. Keep the port's default modules.
+include("$(PORT_DIR)/boards/manifest.py")
+
+freeze("src", "config/pins.py")
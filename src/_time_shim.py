@@ -0,0 +1,17 @@
+# _time_shim.py — desktop shim: MicroPython-style helpers on CPython's `time` module.
+# NOTE: On the Pico these already exist in `time`; install() only fills in what's missing.
+import time as _t
+
+_INSTALLED = False
+
+
+def install():
+    """Add ticks_ms / ticks_diff / sleep_ms to `time` if missing (once per process)."""
+    global _INSTALLED
+    if _INSTALLED:
+        return
+    _INSTALLED = True
+    now, sleep = _t.time, _t.sleep
+    if not hasattr(_t, "ticks_ms"): _t.ticks_ms = lambda: int(now() * 1000)
+    if not hasattr(_t, "ticks_diff"): _t.ticks_diff = lambda a, b: a - b
+    if not hasattr(_t, "sleep_ms"): _t.sleep_ms = lambda ms: sleep(ms * 0.001)
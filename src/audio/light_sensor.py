@@ -3,15 +3,101 @@ Light sensor interface for Raspberry Pi Pico
 Reads analog light values and converts to usable intensity data
 """
 from machine import ADC, Pin
+from array import array
+import machine
+import micropython
+import os
 import time
 
+# rp2.DMA is only available on the Pico; the desktop shim has no 'rp2'
+try:
+    import rp2
+    _HAVE_DMA = hasattr(rp2, "DMA")
+except ImportError:
+    rp2 = None
+    _HAVE_DMA = False
+
+# ADC register bits (RP2040/RP2350 datasheets, ADC chapter)
+_ADC_CS_EN = 1 << 0
+_ADC_CS_START_MANY = 1 << 3
+_ADC_FCS_EN = 1 << 0
+_ADC_FCS_DREQ_EN = 1 << 3
+_ADC_FCS_ERR_CLR = (1 << 10) | (1 << 11)  # UNDER | OVER (write 1 to clear)
+_ADC_FCS_LEVEL = 0xF << 16
+_ADC_FCS_THRESH_1 = 1 << 24
+_ADC_CLK_MHZ = 48
+
+
+@micropython.viper
+def _sample_sum(adc, n: int) -> int:
+    """Sum n ADC samples (viper: native int loop, no per-iteration boxing)"""
+    total = 0
+    i = 0
+    while i < n:
+        total += int(adc.read_u16())
+        i += 1
+    return total
+
+
+class _DMACapture:
+    """
+    Paced ADC capture: the ADC free-runs into its FIFO (one conversion per
+    interval_us; 2 us is the ADC's fastest rate) and a DMA channel drains it into a preallocated buffer, so
+    no bytecode runs per sample
+    """
+    
+    def __init__(self, adc_pin, samples, interval_us=2):
+        rp2350 = "RP2350" in os.uname().machine
+        base = 0x400A0000 if rp2350 else 0x4004C000
+        self._cs = base
+        self._fcs = base + 0x08
+        self._fifo = base + 0x0C
+        self._div = base + 0x10
+        self._cs_idle = _ADC_CS_EN | ((adc_pin - 26) << 12)  # AINSEL
+        self._div_val = min(0xFFFF, _ADC_CLK_MHZ * interval_us - 1) << 8
+        
+        self._buf = array('H', [0] * samples)
+        self._dma = rp2.DMA()
+        self._ctrl = self._dma.pack_ctrl(size=1, inc_read=False, inc_write=True,
+                                         treq_sel=48 if rp2350 else 36)  # DREQ_ADC
+    
+    def _drain(self):
+        mem32 = machine.mem32
+        while mem32[self._fcs] & _ADC_FCS_LEVEL:
+            mem32[self._fifo]
+    
+    def read_sum(self):
+        """Capture len(buffer) samples and return their sum scaled to 16 bits"""
+        mem32 = machine.mem32
+        mem32[self._cs] = self._cs_idle
+        mem32[self._fcs] = _ADC_FCS_ERR_CLR
+        self._drain()
+        mem32[self._div] = self._div_val
+        mem32[self._fcs] = _ADC_FCS_EN | _ADC_FCS_DREQ_EN | _ADC_FCS_THRESH_1 | _ADC_FCS_ERR_CLR
+        
+        self._dma.config(read=self._fifo, write=self._buf, count=len(self._buf),
+                         ctrl=self._ctrl, trigger=True)
+        mem32[self._cs] = self._cs_idle | _ADC_CS_START_MANY
+        while self._dma.active():
+            machine.idle()
+        
+        # Back to one-shot mode so ADC.read_u16() keeps working
+        mem32[self._cs] = self._cs_idle
+        mem32[self._fcs] = _ADC_FCS_ERR_CLR
+        mem32[self._div] = 0
+        self._drain()
+        
+        # FIFO entries are 12-bit; read_u16() reports 16-bit values
+        return sum(self._buf) * 65535 // 4095
+
+
 class LightSensor:
     """
     Light sensor driver using ADC input
     Can work with photoresistor, LDR, or phototransistor
     """
     
-    def __init__(self, adc_pin=28, *, voltage_ref=3.3, samples=10):
+    def __init__(self, adc_pin=28, *, voltage_ref=3.3, samples=10, dma=False):
         """
         Initialize light sensor
         
@@ -19,18 +105,24 @@ class LightSensor:
             adc_pin (int): ADC pin number (26, 27, 28 on Pico)
             voltage_ref (float): Reference voltage (default: 3.3V)
             samples (int): Number of samples to average (default: 10)
+            dma (bool): Capture samples via ADC FIFO + DMA when rp2.DMA exists
         """
         self.adc = ADC(Pin(adc_pin))
         self.voltage_ref = voltage_ref
         self.samples = samples
+        self._capture = _DMACapture(adc_pin, samples) if (dma and _HAVE_DMA) else None
         
         # Calibration values (to be tuned based on sensor and lighting conditions)
         self.min_reading = 100    # Minimum expected ADC value (dark)
         self.max_reading = 65535  # Maximum expected ADC value (bright)
+        self._recompute_scale()
         
-        # Running average filter
-        self.reading_history = []
+        # Running average filter (fixed-size circular buffer + running sum)
         self.history_size = 5
+        self.reading_history = array('I', [0] * self.history_size)
+        self._hist_idx = 0
+        self._hist_count = 0
+        self._hist_sum = 0
         
     def read_raw(self):
         """
@@ -40,12 +132,9 @@ class LightSensor:
             int: Raw 16-bit ADC value (0-65535)
         """
         # Take multiple samples and average
-        total = 0
-        for _ in range(self.samples):
-            total += self.adc.read_u16()
-            time.sleep_ms(1)  # Small delay between samples
-            
-        return total // self.samples
+        if self._capture is not None:
+            return self._capture.read_sum() // self.samples
+        return _sample_sum(self.adc, self.samples) // self.samples
     
     def read_voltage(self):
         """
@@ -54,7 +143,9 @@ class LightSensor:
         Returns:
             float: Voltage value (0.0 to voltage_ref)
         """
-        raw = self.read_raw()
+        return self._raw_to_voltage(self.read_raw())
+    
+    def _raw_to_voltage(self, raw):
         return (raw / 65535.0) * self.voltage_ref
     
     def read_intensity(self):
@@ -64,40 +155,66 @@ class LightSensor:
         Returns:
             float: Light intensity 0.0-100.0 (0=dark, 100=bright)
         """
-        raw = self.read_raw()
+        return self.read_intensity_i() * 0.01
+    
+    def read_intensity_i(self):
+        """
+        Read light intensity as fixed-point percentage (integer math only,
+        the RP2040 has no FPU)
         
-        # Apply running average filter
-        self.reading_history.append(raw)
-        if len(self.reading_history) > self.history_size:
-            self.reading_history.pop(0)
+        Returns:
+            int: Light intensity 0-10000 (percent x 100)
+        """
+        return self._raw_to_intensity_i(self.read_raw())
+    
+    def _raw_to_intensity_i(self, raw):
+        """Push raw into the running-average filter and map it to 0-10000"""
+        # Apply running average filter: overwrite the oldest slot and
+        # keep the sum up to date instead of re-summing the whole window
+        idx = self._hist_idx
+        if self._hist_count == self.history_size:
+            self._hist_sum -= self.reading_history[idx]
+        else:
+            self._hist_count += 1
+        self.reading_history[idx] = raw
+        self._hist_sum += raw
+        self._hist_idx = (idx + 1) % self.history_size
         
         # Calculate filtered average
-        filtered_raw = sum(self.reading_history) // len(self.reading_history)
+        filtered_raw = self._hist_sum // self._hist_count
         
-        # Map to 0-100 range with calibrated min/max
+        # Map to 0-10000 range with calibrated min/max
         clamped = max(self.min_reading, min(filtered_raw, self.max_reading))
-        intensity = ((clamped - self.min_reading) / 
-                    (self.max_reading - self.min_reading)) * 100.0
+        intensity = (clamped - self.min_reading) * 10000 // self._span
         
-        return max(0.0, min(100.0, intensity))
+        return intensity if intensity < 10000 else 10000
     
-    def calibrate(self, dark_samples=20, bright_samples=20):
+    def _recompute_scale(self):
+        """Cache the calibrated raw span; call whenever min/max calibration changes"""
+        self._span = max(1, self.max_reading - self.min_reading)
+    
+    def calibrate(self, dark_samples=20, bright_samples=20, *, wait_fn=None):
         """
         Auto-calibrate sensor based on current lighting conditions
         
         Args:
             dark_samples (int): Number of samples to take for dark calibration
             bright_samples (int): Number of samples for bright calibration
+            wait_fn (callable): Called with the prompt text; returns once the user
+                is ready. Defaults to a blocking 3 s sleep.
         """
+        if wait_fn is None:
+            wait_fn = lambda prompt: time.sleep(3)  # noqa: E731
+        
         print("Calibrating light sensor...")
         
         print("Cover sensor for dark calibration...")
-        time.sleep(3)  # Give user time to cover sensor
+        wait_fn("Cover sensor for dark calibration...")  # Give user time to cover sensor
         
         # Sample dark condition
-        dark_readings = []
+        dark_readings = array('I', [0] * dark_samples)
         for i in range(dark_samples):
-            dark_readings.append(self.read_raw())
+            dark_readings[i] = self.read_raw()
             time.sleep_ms(100)
             if i % 5 == 0:
                 print(f"Dark sample {i+1}/{dark_samples}")
@@ -105,23 +222,31 @@ class LightSensor:
         self.min_reading = sum(dark_readings) // len(dark_readings)
         
         print("Expose sensor to bright light...")
-        time.sleep(3)  # Give user time to expose sensor
+        wait_fn("Expose sensor to bright light...")  # Give user time to expose sensor
         
         # Sample bright condition  
-        bright_readings = []
+        bright_readings = array('I', [0] * bright_samples)
         for i in range(bright_samples):
-            bright_readings.append(self.read_raw())
+            bright_readings[i] = self.read_raw()
             time.sleep_ms(100)
             if i % 5 == 0:
                 print(f"Bright sample {i+1}/{bright_samples}")
         
         self.max_reading = sum(bright_readings) // len(bright_readings)
+        self._recompute_scale()
         
         print(f"Calibration complete:")
         print(f"  Dark level: {self.min_reading}")
         print(f"  Bright level: {self.max_reading}")
         print(f"  Range: {self.max_reading - self.min_reading}")
     
+    def _read_all(self):
+        """One sample burst feeding raw, voltage and intensity"""
+        raw = self.read_raw()
+        voltage = self._raw_to_voltage(raw)
+        intensity = self._raw_to_intensity_i(raw) * 0.01
+        return raw, voltage, intensity
+    
     def get_debug_info(self):
         """
         Get debug information about sensor readings
@@ -129,9 +254,7 @@ class LightSensor:
         Returns:
             dict: Debug information including raw, voltage, and intensity
         """
-        raw = self.read_raw()
-        voltage = self.read_voltage()
-        intensity = self.read_intensity()
+        raw, voltage, intensity = self._read_all()
         
         return {
             "raw": raw,
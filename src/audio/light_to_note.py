@@ -2,7 +2,40 @@
 Light to note mapping system for Light Orchestra
 Converts light intensity values to musical notes and parameters
 """
+from array import array
 import math
+import micropython
+
+_MIN_DURATION_MS = 100   # light_to_duration() defaults
+_MAX_DURATION_MS = 1000
+
+
+# Scalar mapping kernels (native-emitted on the Pico; shared by the
+# per-field methods and create_note_event so intensity is normalized once)
+@micropython.native
+def _normalize(light_intensity):
+    """Light intensity 0.0-100.0 -> 0.0-1.0 (clamped)"""
+    normalized = light_intensity / 100.0
+    if normalized < 0.0:
+        return 0.0
+    if normalized > 1.0:
+        return 1.0
+    return normalized
+
+@micropython.native
+def _note_impl(normalized, note_sequence, last_index):
+    return note_sequence[int(normalized * last_index)]
+
+@micropython.native
+def _velocity_impl(normalized, velocity_min, velocity_max):
+    # Square root curve makes low light more responsive
+    return velocity_min + (math.sqrt(normalized) * (velocity_max - velocity_min))
+
+@micropython.native
+def _duration_impl(normalized, min_duration_ms, max_duration_ms):
+    # Brighter light = shorter, more staccato notes
+    return int(max_duration_ms - (normalized * (max_duration_ms - min_duration_ms)))
+
 
 class LightToNoteMapper:
     """
@@ -45,25 +78,19 @@ class LightToNoteMapper:
         if self.scale not in self.scales:
             self.scale = "chromatic"
         
-        scale_intervals = self.scales[self.scale]
-        self.note_sequence = []
-        
-        # Generate notes within range using scale intervals
-        current_note = self.min_note
-        while current_note <= self.max_note:
-            # Find which octave and note within scale
-            octave_offset = 0
-            
-            # Add notes for this octave
-            for interval in scale_intervals:
-                note = current_note + interval + (octave_offset * 12)
-                if self.min_note <= note <= self.max_note:
-                    self.note_sequence.append(note)
-            
-            current_note += 12  # Next octave
-        
-        # Sort and remove duplicates
-        self.note_sequence = sorted(list(set(self.note_sequence)))
+        # Every scale note, octave by octave, within [min_note, max_note].
+        # Intervals are ascending and < 12, so this emits each note once, in order
+        lo, hi = self.min_note, self.max_note
+        intervals = self.scales[self.scale]
+        notes = []
+        for root in range(lo, hi + 1, 12):
+            for interval in intervals:
+                n = root + interval
+                if n > hi:
+                    break
+                notes.append(n)
+        self.note_sequence = tuple(notes)
+        self._scale_len_m1 = len(notes) - 1
     
     def set_scale(self, scale):
         """
@@ -106,12 +133,8 @@ class LightToNoteMapper:
         if not self.note_sequence:
             return 60  # Middle C fallback
         
-        # Normalize intensity to 0-1 range
-        normalized = max(0.0, min(1.0, light_intensity / 100.0))
-        
-        # Map to note sequence
-        note_index = int(normalized * (len(self.note_sequence) - 1))
-        return self.note_sequence[note_index]
+        # Normalize intensity to 0-1 range and map to note sequence
+        return _note_impl(_normalize(light_intensity), self.note_sequence, self._scale_len_m1)
     
     def light_to_velocity(self, light_intensity):
         """
@@ -123,17 +146,11 @@ class LightToNoteMapper:
         Returns:
             float: Velocity value 0.0-1.0
         """
-        # Normalize intensity
-        normalized = max(0.0, min(1.0, light_intensity / 100.0))
-        
-        # Apply curve for more musical response
-        # Square root curve makes low light more responsive
-        curved = math.sqrt(normalized)
-        
-        # Map to velocity range
-        return self.velocity_min + (curved * (self.velocity_max - self.velocity_min))
+        # Apply square root curve for more musical response, map to velocity range
+        return _velocity_impl(_normalize(light_intensity), self.velocity_min, self.velocity_max)
     
-    def light_to_duration(self, light_intensity, *, min_duration_ms=100, max_duration_ms=1000):
+    def light_to_duration(self, light_intensity, *, min_duration_ms=_MIN_DURATION_MS,
+                          max_duration_ms=_MAX_DURATION_MS):
         """
         Convert light intensity to note duration
         
@@ -145,12 +162,9 @@ class LightToNoteMapper:
         Returns:
             int: Duration in milliseconds
         """
-        normalized = max(0.0, min(1.0, light_intensity / 100.0))
-        
         # Brighter light = shorter, more staccato notes
         # Dimmer light = longer, more sustained notes
-        duration = max_duration_ms - (normalized * (max_duration_ms - min_duration_ms))
-        return int(duration)
+        return _duration_impl(_normalize(light_intensity), min_duration_ms, max_duration_ms)
     
     def create_note_event(self, light_intensity):
         """
@@ -162,13 +176,38 @@ class LightToNoteMapper:
         Returns:
             dict: Note event with pitch, velocity, duration
         """
+        normalized = _normalize(light_intensity)
         return {
-            "pitch": self.light_to_note(light_intensity),
-            "velocity": self.light_to_velocity(light_intensity),
-            "duration_ms": self.light_to_duration(light_intensity),
+            "pitch": (_note_impl(normalized, self.note_sequence, self._scale_len_m1)
+                      if self.note_sequence else 60),
+            "velocity": _velocity_impl(normalized, self.velocity_min, self.velocity_max),
+            "duration_ms": _duration_impl(normalized, _MIN_DURATION_MS, _MAX_DURATION_MS),
             "light_intensity": light_intensity
         }
     
+    def map_light_batch(self, intensities):
+        """
+        Map many light readings at once (logged light, offline rendering)
+        
+        Args:
+            intensities (iterable): Light intensities 0.0-100.0
+            
+        Returns:
+            tuple: (pitches, velocities, durations) as array('B'), array('f'), array('H')
+        """
+        seq = self.note_sequence
+        last_index = self._scale_len_m1
+        vmin, vmax = self.velocity_min, self.velocity_max
+        pitches = array('B')
+        velocities = array('f')
+        durations = array('H')
+        for light_intensity in intensities:
+            normalized = _normalize(light_intensity)
+            pitches.append(_note_impl(normalized, seq, last_index) if seq else 60)
+            velocities.append(_velocity_impl(normalized, vmin, vmax))
+            durations.append(_duration_impl(normalized, _MIN_DURATION_MS, _MAX_DURATION_MS))
+        return pitches, velocities, durations
+    
     def get_scale_info(self):
         """
         Get information about current scale and mapping
@@ -181,5 +220,5 @@ class LightToNoteMapper:
             "min_note": self.min_note,
             "max_note": self.max_note,
             "available_notes": len(self.note_sequence),
-            "note_range": self.note_sequence[:5] if len(self.note_sequence) >= 5 else self.note_sequence
+            "note_range": list(self.note_sequence[:5])
         }
@@ -12,6 +12,9 @@ Requires:
 """
 
 import time
+import _thread
+import micropython
+from machine import Timer
 from config.pins import PIN_BUZZER, LOOP_PERIOD_MS
 from hal.pwm_audio import PWMAudio
 from .synth import Synth
@@ -19,20 +22,25 @@ from .light_sensor import LightSensor
 from .switches import SwitchController
 from .light_to_note import LightToNoteMapper
 
+_NOTE_FMT = "♪ Light: %.1f%% → Note: %d (vel: %.2f, dur: %d ms)"
+
 
 class LightOrchestra:
     """
     Coordinates all hardware components and manages the light-to-music conversion.
     """
 
-    SCALES = ["chromatic", "major", "minor", "pentatonic", "blues", "dorian"]
+    SCALES = ("chromatic", "major", "minor", "pentatonic", "blues", "dorian")
+    _SCALE_IDX = {name: i for i, name in enumerate(SCALES)}  # name -> position, O(1)
 
-    def __init__(self, *, audio_pin: int = PIN_BUZZER, light_pin: int = 28, switch_pins=(16, 17)):
+    def __init__(self, *, audio_pin: int = PIN_BUZZER, light_pin: int = 28, switch_pins=(16, 17),
+                 threaded_light: bool = False):
         """
         Args:
             audio_pin: GPIO pin for piezo buzzer
             light_pin: ADC pin for light sensor
             switch_pins: GPIO pins for tactile switches (sw_1, sw_2)
+            threaded_light: sample the light sensor on a second thread (core 1 on the Pico)
         """
         print("Initializing Light Orchestra...")
 
@@ -44,17 +52,23 @@ class LightOrchestra:
 
         # Mapping system
         self.mapper = LightToNoteMapper(min_note=48, max_note=84, scale="pentatonic")
+        self._scale_idx = self._SCALE_IDX.get(getattr(self.mapper, "scale", None), 0)
+
+        # Bound methods used on the note path (skip per-call attribute chains)
+        self._create_note_event = self.mapper.create_note_event
+        self._note_on = self.synth.note_on
+        self._synth_tick = self.synth.tick
 
         # System state
         self.running = False
         self.paused = False
-        self.current_light = 0.0      # percent (0..100)
+        self.current_light_i = 0      # percent x 100 (0..10000), fixed-point
         self.current_note = None
         self.last_note_time = 0
         self.min_note_interval_ms = 100  # Minimum time between new notes
 
         # Configuration
-        self.sensitivity = 1.0  # Light sensitivity multiplier
+        self.sensitivity = 1.0  # Light sensitivity multiplier (stored as Q8 fixed-point)
         self.auto_play = True   # Automatically play notes based on light
         self.debug_output = True
 
@@ -63,18 +77,69 @@ class LightOrchestra:
         self.light_read_interval_ms = 50
         self.last_light_read = 0
 
+        # Optional second-core light sampling (see _light_worker)
+        self.threaded_light = bool(threaded_light)
+        self._light_shared = 0          # latest reading published by the worker
+        self._light_worker_running = False
+        self._sensor_lock = _thread.allocate_lock()
+        self._calibrating = False       # status prints skip while calibration holds the lock
+
+        # Periodic status output runs from a soft timer, not the main loop
+        self.status_interval_ms = 5000
+        self._status_timer = None
+        self._print_status_cb = self._print_status_safe  # bound once (no alloc in callback)
+
         print("Light Orchestra initialized successfully")
 
+    # ---------- Fixed-point state ----------
+    @property
+    def current_light(self) -> float:
+        """Last light reading as percentage (0..100)."""
+        return self.current_light_i * 0.01
+
+    @property
+    def sensitivity(self) -> float:
+        return self._sensitivity_q8 / 256.0
+
+    @sensitivity.setter
+    def sensitivity(self, value: float):
+        self._sensitivity_q8 = int(value * 256 + 0.5)
+
     # ---------- User controls ----------
     def calibrate_light_sensor(self):
         """Calibrate the light sensor for current environment."""
         print("\n=== LIGHT SENSOR CALIBRATION ===")
-        self.light_sensor.calibrate()
+        # Scheduled status prints run inside calibration's sleeps on this same
+        # thread; _sensor_lock isn't reentrant, so they must not try to take it
+        self._calibrating = True
+        try:
+            with self._sensor_lock:
+                self.light_sensor.calibrate(wait_fn=self._wait_for_sw1)
+        finally:
+            self._calibrating = False
         print("Calibration complete!\n")
 
+    def _wait_for_sw1(self, prompt: str, timeout_ms: int = 10000):
+        """Calibration wait: keep switches and synth ticking until SW1 is pressed (or timeout)."""
+        print("  (press SW1 when ready)")
+        start = time.ticks_ms()
+        while True:
+            now = time.ticks_ms()
+            self.switches.update()
+            if "sw_1" in self.switches.get_events()["pressed"]:
+                return
+            if time.ticks_diff(now, start) >= timeout_ms:
+                return
+            self._synth_tick(now)
+            time.sleep_ms(self.tick_interval_ms)
+
     def set_scale(self, scale_name: str):
         """Change musical scale."""
         self.mapper.set_scale(scale_name)
+        # keep the cycling cursor in sync when called from outside the sw_2 path
+        idx = self._SCALE_IDX.get(scale_name)
+        if idx is not None:
+            self._scale_idx = idx
         if self.debug_output:
             print(f"Scale changed to: {scale_name}")
 
@@ -107,13 +172,8 @@ class LightOrchestra:
 
         # Switch 2: Cycle through scales
         if "sw_2" in events["pressed"]:
-            cur = getattr(self.mapper, "scale", self.SCALES[0])
-            try:
-                idx = self.SCALES.index(cur)
-            except ValueError:
-                idx = 0
-            next_scale = self.SCALES[(idx + 1) % len(self.SCALES)]
-            self.set_scale(next_scale)
+            self._scale_idx = (self._scale_idx + 1) % len(self.SCALES)
+            self.set_scale(self.SCALES[self._scale_idx])
 
         # Switch 2 held: Toggle debug output
         if "sw_2" in events["held"]:
@@ -135,27 +195,48 @@ class LightOrchestra:
         val = float(self.light_sensor.read())
         return 100.0 * self._clamp(val, 0.0, 1.0)
 
-    def update_light_reading(self, now_ms: int):
+    def _read_light_i(self) -> int:
+        """
+        Return light as fixed-point percentage (0..10000).
+        Prefers LightSensor.read_intensity_i(); falls back to the float path.
+        """
+        if hasattr(self.light_sensor, "read_intensity_i"):
+            return self.light_sensor.read_intensity_i()
+        return int(self._read_light_percent() * 100.0)
+
+    def update_light_reading(self, now_ms: int, _td=time.ticks_diff):
         """Update light sensor reading with rate limiting (wrap-safe)."""
-        if time.ticks_diff(now_ms, self.last_light_read) >= self.light_read_interval_ms:
-            self.current_light = self._read_light_percent()
+        if self._light_worker_running:
+            # Worker owns the ADC; just pick up its latest value (never blocks)
+            self.current_light_i = self._light_shared
+            return
+        if _td(now_ms, self.last_light_read) >= self.light_read_interval_ms:
+            self.current_light_i = self._read_light_i()
             self.last_light_read = now_ms
 
-    def process_light_to_music(self, now_ms: int):
+    def process_light_to_music(self, now_ms: int, _td=time.ticks_diff):
         """Convert current light reading to musical output."""
         if self.paused or not self.auto_play:
             return
 
-        adjusted_light = self._clamp(self.current_light * self.sensitivity, 0.0, 100.0)
-
         # Only trigger new notes if minimum interval has passed
-        if time.ticks_diff(now_ms, self.last_note_time) < self.min_note_interval_ms:
+        # (cheapest check first: most ticks stop here)
+        if _td(now_ms, self.last_note_time) < self.min_note_interval_ms:
             return
 
+        # Sample light on demand, only when a note may be emitted
+        self.update_light_reading(now_ms)
+
+        # Integer-only scaling/threshold (soft-float is slow on the RP2040)
+        adjusted = (self.current_light_i * self._sensitivity_q8) >> 8
+        if adjusted > 10000:
+            adjusted = 10000
+
         # Create & play note event (threshold to avoid noise)
-        if adjusted_light > 5.0:
-            note_event = self.mapper.create_note_event(adjusted_light)
-            self.synth.note_on(
+        if adjusted > 500:
+            adjusted_light = adjusted * 0.01
+            note_event = self._create_note_event(adjusted_light)
+            self._note_on(
                 note_event["pitch"],
                 velocity=note_event["velocity"],
                 duration_ms=note_event["duration_ms"],
@@ -165,19 +246,30 @@ class LightOrchestra:
             self.last_note_time = now_ms
 
             if self.debug_output:
-                print(
-                    "♪ Light: {:.1f}% → Note: {} (vel: {:.2f}, dur: {} ms)".format(
-                        adjusted_light,
-                        note_event["pitch"],
-                        note_event["velocity"],
-                        note_event["duration_ms"],
-                    )
-                )
+                print(_NOTE_FMT % (adjusted_light, note_event["pitch"],
+                                   note_event["velocity"], note_event["duration_ms"]))
+
+    def _light_worker(self):
+        """Second-thread loop: sample + filter the sensor and publish the result."""
+        try:
+            while self.running:
+                with self._sensor_lock:
+                    self._light_shared = self._read_light_i()
+                time.sleep_ms(self.light_read_interval_ms)
+        finally:
+            self._light_worker_running = False
+
+    def _start_light_worker(self):
+        if self._light_worker_running:
+            return
+        self._light_worker_running = True
+        _thread.start_new_thread(self._light_worker, ())
 
     # ---------- Status ----------
     def print_status(self):
         """Print current system status."""
-        light_debug = self.light_sensor.get_debug_info()
+        with self._sensor_lock:
+            light_debug = self.light_sensor.get_debug_info()
         scale_info = self.mapper.get_scale_info()
 
         print("\n=== LIGHT ORCHESTRA STATUS ===")
@@ -190,6 +282,27 @@ class LightOrchestra:
         print("Controls: SW1=Play/Pause(hold=calibrate), SW2=Scale(hold=debug)")
         print("===========================\n")
 
+    def _print_status_safe(self, _arg):
+        """Scheduled status print; never lets an error escape into the scheduler."""
+        if not (self.running and self.debug_output) or self._calibrating:
+            return
+        try:
+            self.print_status()
+        except Exception as e:
+            print("Status error:", e)
+
+    def _on_status_timer(self, _timer):
+        # Defer the heavy work out of timer context
+        try:
+            micropython.schedule(self._print_status_cb, 0)
+        except RuntimeError:
+            pass  # schedule queue full; skip this status frame
+
+    def _start_status_timer(self):
+        self._status_timer = Timer(-1)
+        self._status_timer.init(period=self.status_interval_ms, mode=Timer.PERIODIC,
+                                callback=self._on_status_timer)
+
     # ---------- Main loop ----------
     def run(self):
         """Main orchestrator loop."""
@@ -200,31 +313,42 @@ class LightOrchestra:
         print("  Ctrl+C: Stop\n")
 
         self.running = True
-        last_status_print = 0
-        status_interval_ms = 5000  # Print status every 5 seconds
+        if self.threaded_light:
+            self._start_light_worker()
+        self._start_status_timer()  # Print status every status_interval_ms
+
+        # Bind hot-loop callables to locals (fast local loads instead of
+        # global/attribute lookups on every iteration)
+        ticks_ms = time.ticks_ms
+        ticks_diff = time.ticks_diff
+        sleep_ms = time.sleep_ms
+        sw_update = self.switches.update
+        handle_sw = self.handle_switch_events
+        process = self.process_light_to_music
+        synth_tick = self._synth_tick
+        synth_busy = self.synth.needs_tick
+        tick_int = self.tick_interval_ms
 
         try:
             while self.running:
-                now_ms = time.ticks_ms()
+                now_ms = ticks_ms()
 
-                # Update all input components
-                self.switches.update()
-                self.update_light_reading(now_ms)
+                # Update inputs (light is sampled on demand by process())
+                sw_update()
 
                 # Process events and control logic
-                self.handle_switch_events()
-                self.process_light_to_music(now_ms)
-
-                # Update audio synthesis (envelope, etc.)
-                self.synth.tick(now_ms)
+                handle_sw()
+                process(now_ms)
 
-                # Periodic status output
-                if self.debug_output and time.ticks_diff(now_ms, last_status_print) >= status_interval_ms:
-                    self.print_status()
-                    last_status_print = now_ms
+                # Update audio synthesis (envelope, etc.); nothing to do while silent
+                if synth_busy():
+                    synth_tick(now_ms)
 
-                # Maintain loop timing
-                time.sleep_ms(self.tick_interval_ms)
+                # Maintain loop timing: sleep only for what is left of this
+                # tick, so work done above doesn't stretch the loop period
+                remaining = tick_int - ticks_diff(ticks_ms(), now_ms)
+                if remaining > 0:
+                    sleep_ms(remaining)
 
         except KeyboardInterrupt:
             print("\nStopping Light Orchestra...")
@@ -234,6 +358,9 @@ class LightOrchestra:
     def stop(self):
         """Clean shutdown of all components."""
         self.running = False
+        if self._status_timer is not None:
+            self._status_timer.deinit()
+            self._status_timer = None
         self.synth.all_notes_off()
         self.pwm_audio.stop()
         print("Light Orchestra stopped.")
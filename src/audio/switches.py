@@ -3,8 +3,15 @@ Tactile switch interface for user controls
 Handles button presses with debouncing and event detection
 """
 from machine import Pin
+from micropython import const
+import micropython
 import time
 
+# Event flag bits (one int per TactileSwitch, one byte per SwitchController slot)
+_FLAG_PRESSED = const(1)
+_FLAG_RELEASED = const(2)
+_FLAG_HELD = const(4)
+
 class TactileSwitch:
     """
     Individual tactile switch with debouncing
@@ -22,33 +29,30 @@ class TactileSwitch:
         self.pin = Pin(pin_num, Pin.IN, Pin.PULL_UP if pull_up else None)
         self.debounce_ms = debounce_ms
         self.pull_up = pull_up
+        self._active = 0 if pull_up else 1  # Active low for pull-up configuration
         
         # State tracking
         self.last_state = self.pin.value()
         self.current_state = self.last_state
         self.last_change_time = time.ticks_ms()
         
-        # Event flags
-        self.pressed = False
-        self.released = False
-        self.held = False
+        # Event flags (bit0=pressed, bit1=released, bit2=held)
+        self._flags = 0
         self.hold_threshold_ms = 1000  # 1 second for long press
         self.press_start_time = 0
         
-    def update(self):
+    @micropython.native
+    def update(self, _ticks=time.ticks_ms, _diff=time.ticks_diff):
         """
         Update switch state and detect events
         Must be called regularly (every few ms) in main loop
         """
-        now = time.ticks_ms()
+        now = _ticks()
         raw_state = self.pin.value()
+        active_state = self._active
         
-        # Active low for pull-up configuration
-        active_state = 0 if self.pull_up else 1
-        
-        # Reset event flags
-        self.pressed = False
-        self.released = False
+        # Reset event flags (held survives until release)
+        f = self._flags & _FLAG_HELD
         
         # Debouncing
         if raw_state != self.last_state:
@@ -56,65 +60,180 @@ class TactileSwitch:
             self.last_state = raw_state
         
         # Update current state after debounce period
-        if time.ticks_diff(now, self.last_change_time) >= self.debounce_ms:
+        if _diff(now, self.last_change_time) >= self.debounce_ms:
             if raw_state != self.current_state:
                 # State changed after debounce
                 if raw_state == active_state:
                     # Button pressed
-                    self.pressed = True
+                    f = _FLAG_PRESSED
                     self.press_start_time = now
-                    self.held = False
                 else:
                     # Button released
-                    self.released = True
-                    self.held = False
+                    f = _FLAG_RELEASED
                 
                 self.current_state = raw_state
         
         # Check for held state
-        if self.current_state == active_state and not self.held:
-            if time.ticks_diff(now, self.press_start_time) >= self.hold_threshold_ms:
-                self.held = True
+        if self.current_state == active_state and not (f & _FLAG_HELD):
+            if _diff(now, self.press_start_time) >= self.hold_threshold_ms:
+                f |= _FLAG_HELD
+        
+        self._flags = f
     
     def is_pressed(self):
         """Check if button is currently pressed"""
-        active_state = 0 if self.pull_up else 1
-        return self.current_state == active_state
+        return self.current_state == self._active
     
     def was_pressed(self):
         """Check if button was just pressed this update cycle"""
-        return self.pressed
+        return bool(self._flags & _FLAG_PRESSED)
     
     def was_released(self):
         """Check if button was just released this update cycle"""
-        return self.released
+        return bool(self._flags & _FLAG_RELEASED)
     
     def is_held(self):
         """Check if button is being held (long press)"""
-        return self.held
+        return bool(self._flags & _FLAG_HELD)
+    
+    # Attribute-style access to the event flags
+    pressed = property(was_pressed)
+    released = property(was_released)
+    held = property(is_held)
+
+class _SwitchView:
+    """
+    Read-only TactileSwitch-style view of one SwitchController bit
+    """
+    
+    def __init__(self, ctrl, i):
+        self._ctrl = ctrl
+        self._bit = 1 << i
+    
+    def is_pressed(self):
+        return bool(self._ctrl._stable & self._bit)
+    
+    def was_pressed(self):
+        return bool(self._ctrl._pressed & self._bit)
+    
+    def was_released(self):
+        return bool(self._ctrl._released & self._bit)
+    
+    def is_held(self):
+        return bool(self._ctrl._held & self._bit)
 
 class SwitchController:
     """
     Controller for multiple tactile switches
+    All switches share one debounce time, so their states are packed one
+    bit per switch into ints and debounced together with bitwise ops
+    (bit i = switch i, 1 = pressed)
     """
     
-    def __init__(self, switch_pins):
+    def __init__(self, switch_pins, *, debounce_ms=50, irq=True):
         """
         Initialize switch controller
         
         Args:
             switch_pins (list): List of GPIO pin numbers for switches
+            debounce_ms (int): Debounce time shared by all switches
+            irq (bool): Only sample the pins after an edge IRQ (or while a
+                change is still settling) instead of on every update; falls
+                back to polling where Pin has no IRQ support
         """
-        self.switches = {}
+        n = len(switch_pins)
+        self._n = n
+        self._names = [f"sw_{i+1}" for i in range(n)]
+        self._idx = {name: i for i, name in enumerate(self._names)}
+        self._pins = [Pin(p, Pin.IN, Pin.PULL_UP) for p in switch_pins]
+        self.debounce_ms = debounce_ms
+        self.hold_threshold_ms = 1000  # 1 second for long press
+        
+        # Packed state
+        self._last_raw = self._read_raw()
+        self._stable = self._last_raw
+        self._pressed = 0
+        self._released = 0
+        self._held = 0
         
-        for i, pin_num in enumerate(switch_pins):
-            switch_name = f"sw_{i+1}"
-            self.switches[switch_name] = TactileSwitch(pin_num)
+        # Per-switch timestamps, only touched for bits that changed
+        self._change = [time.ticks_ms()] * n
+        self._press_t = [0] * n
+        
+        # Edge IRQs: each pin's hard ISR ORs its bit into _edges (no allocation)
+        self._edges = 0
+        self._irq = irq and hasattr(Pin, "IRQ_FALLING")
+        if self._irq:
+            trigger = Pin.IRQ_FALLING | Pin.IRQ_RISING
+            for i, pin in enumerate(self._pins):
+                pin.irq(trigger=trigger, handler=self._edge_handler(1 << i), hard=True)
+    
+    def _edge_handler(self, bit):
+        def isr(pin):
+            self._edges |= bit
+        return isr
+    
+    def _read_raw(self):
+        """Sample every pin into one int (pull-up: low level = pressed)"""
+        raw = 0
+        pins = self._pins
+        for i in range(self._n):
+            raw |= (pins[i].value() ^ 1) << i
+        return raw
     
-    def update(self):
+    @micropython.native
+    def update_packed(self, _ticks=time.ticks_ms, _diff=time.ticks_diff):
         """Update all switches"""
-        for switch in self.switches.values():
-            switch.update()
+        now = _ticks()
+        if self._irq and not self._edges and self._last_raw == self._stable:
+            # No edge since the last read and nothing settling: pins are unchanged
+            raw = self._last_raw
+        else:
+            self._edges = 0  # cleared before the read: a later edge re-arms it
+            raw = self._read_raw()
+        
+        # One XOR finds every pin that moved; restart only their timers
+        changed = raw ^ self._last_raw
+        if changed:
+            change = self._change
+            for i in range(self._n):
+                if changed & (1 << i):
+                    change[i] = now
+            self._last_raw = raw
+        
+        # Commit pending bits whose input has been stable for debounce_ms
+        stable = self._stable
+        pending = raw ^ stable
+        commit = 0
+        if pending:
+            change = self._change
+            debounce_ms = self.debounce_ms
+            for i in range(self._n):
+                bit = 1 << i
+                if pending & bit and _diff(now, change[i]) >= debounce_ms:
+                    commit |= bit
+        new_stable = stable ^ commit
+        
+        pressed = new_stable & ~stable
+        self._pressed = pressed
+        self._released = stable & ~new_stable
+        self._stable = new_stable
+        
+        # Held: cleared on any edge, set once a press outlasts hold_threshold_ms
+        held = self._held & new_stable & ~pressed
+        press_t = self._press_t
+        waiting = new_stable & ~held
+        if waiting:
+            hold_ms = self.hold_threshold_ms
+            for i in range(self._n):
+                bit = 1 << i
+                if pressed & bit:
+                    press_t[i] = now
+                if waiting & bit and _diff(now, press_t[i]) >= hold_ms:
+                    held |= bit
+        self._held = held
+    
+    update = update_packed
     
     def get_switch(self, name):
         """
@@ -124,17 +243,21 @@ class SwitchController:
             name (str): Switch name (e.g., 'sw_1', 'sw_2')
             
         Returns:
-            TactileSwitch: Switch object or None if not found
+            _SwitchView: Switch view or None if not found
         """
-        return self.switches.get(name)
+        i = self._idx.get(name)
+        return None if i is None else _SwitchView(self, i)
     
     def any_pressed(self):
         """Check if any switch was just pressed"""
-        return any(sw.was_pressed() for sw in self.switches.values())
+        return self._pressed != 0
     
     def any_released(self):
         """Check if any switch was just released"""
-        return any(sw.was_released() for sw in self.switches.values())
+        return self._released != 0
+    
+    def _names_in(self, bits):
+        return [name for i, name in enumerate(self._names) if bits >> i & 1]
     
     def get_pressed_switches(self):
         """
@@ -143,7 +266,7 @@ class SwitchController:
         Returns:
             list: Names of pressed switches
         """
-        return [name for name, sw in self.switches.items() if sw.is_pressed()]
+        return self._names_in(self._stable)
     
     def get_events(self):
         """
@@ -152,21 +275,9 @@ class SwitchController:
         Returns:
             dict: Dictionary with event information
         """
-        events = {
-            'pressed': [],
-            'released': [],
-            'held': [],
-            'active': []
+        return {
+            'pressed': self._names_in(self._pressed),
+            'released': self._names_in(self._released),
+            'held': self._names_in(self._held),
+            'active': self._names_in(self._stable)
         }
-        
-        for name, switch in self.switches.items():
-            if switch.was_pressed():
-                events['pressed'].append(name)
-            if switch.was_released():
-                events['released'].append(name)
-            if switch.is_held():
-                events['held'].append(name)
-            if switch.is_pressed():
-                events['active'].append(name)
-        
-        return events
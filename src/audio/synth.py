@@ -1,4 +1,38 @@
 # src/audio/synth.py
+from array import array
+import micropython
+
+# Equal-tempered frequency of every MIDI pitch (A4 = 69 = 440 Hz); 512 bytes
+_MIDI_HZ = array('f', [440.0 * (2 ** ((p - 69) / 12.0)) for p in range(128)])
+
+
+@micropython.native
+def _env_level(t, attack_ms, inv_attack, decay_ms, inv_decay, sustain):
+    """Attack/decay level (0..1) t ms after note-on; multiplies only, no divides."""
+    if t < attack_ms:
+        return t * inv_attack
+    # Decay toward sustain after attack (linear)
+    td = t - attack_ms
+    if td >= decay_ms:
+        return sustain
+    return sustain + (1.0 - sustain) * (1.0 - td * inv_decay)
+
+_DUTY_LSB = 1.0 / 65536  # one step of the 16-bit PWM duty register
+
+
+@micropython.native
+def _clamp01(x):
+    if x < 0.0:
+        return 0.0
+    if x > 1.0:
+        return 1.0
+    return x
+
+
+class _Voice:
+    """Mutable per-voice state; one is preallocated per Synth so note_on() never allocates."""
+    __slots__ = ("pitch", "freq", "vel", "t0", "released", "t_release", "duration_ms", "level")
+
 
 class Synth:
     """
@@ -9,21 +43,36 @@ class Synth:
     def __init__(self, pwm_driver, *, max_voices=1, vol_default=0.6):
         self.pwm = pwm_driver
         self.master = float(vol_default)
-        self.env = {"attack_ms": 5, "decay_ms": 30, "sustain": 0.7, "release_ms": 40}
-        self.voice = None  # mono for v1
+        self.set_envelope()
+        self._voice = _Voice()
+        self.voice = None  # mono for v1: self._voice while sounding, else None
         self.active = False
+        self._last_duty = None  # last duty written to the PWM (None = unknown)
+        self._dirty = False     # voice levels changed since the last flush()
 
     @staticmethod
     def midi_to_hz(pitch: int) -> float:
         if not (0 <= pitch <= 127):
             raise ValueError("pitch out of range 0..127")
-        return 440.0 * (2 ** ((pitch - 69) / 12.0))
+        return _MIDI_HZ[pitch]
 
     def set_envelope(self, *, attack_ms=5, decay_ms=30, sustain_level=0.7, release_ms=40):
         if not (0.0 <= sustain_level <= 1.0):
             raise ValueError("sustain_level must be 0..1")
-        self.env = {"attack_ms": int(attack_ms), "decay_ms": int(decay_ms),
-                    "sustain": float(sustain_level), "release_ms": int(release_ms)}
+        self._attack_ms = int(attack_ms)
+        self._decay_ms = int(decay_ms)
+        self._sustain = float(sustain_level)
+        self._release_ms = int(release_ms)
+        # reciprocals so tick() multiplies instead of divides (0 when the stage is skipped)
+        self._inv_attack = 1.0 / self._attack_ms if self._attack_ms > 0 else 0.0
+        self._inv_decay = 1.0 / self._decay_ms if self._decay_ms > 0 else 0.0
+        self._inv_release = 1.0 / self._release_ms if self._release_ms > 0 else 0.0
+
+    @property
+    def env(self):
+        """Current envelope settings as a dict (read-only view)."""
+        return {"attack_ms": self._attack_ms, "decay_ms": self._decay_ms,
+                "sustain": self._sustain, "release_ms": self._release_ms}
 
     def set_volume(self, master_vol_0_1: float):
         if not (0.0 <= master_vol_0_1 <= 1.0):
@@ -34,95 +83,108 @@ class Synth:
         if not (0.0 <= velocity <= 1.0):
             raise ValueError("velocity must be 0..1")
         freq = self.midi_to_hz(pitch)
-        self.voice = {
-            "pitch": pitch, "freq": freq, "vel": float(velocity),
-            "t0": int(now_ms), "released": False, "t_release": None,
-            "duration_ms": int(duration_ms) if duration_ms is not None else None,
-            "level": 0.0
-        }
+        v = self._voice
+        v.pitch = pitch
+        v.freq = freq
+        v.vel = float(velocity)
+        v.t0 = int(now_ms)
+        v.released = False
+        v.t_release = None
+        v.duration_ms = int(duration_ms) if duration_ms is not None else None
+        v.level = 0.0
+        self.voice = v
         try:
             self.pwm.set_freq(freq)      # reduce start latency
             self.pwm.set_duty(0.0)
+            self._last_duty = 0.0
         except Exception:
-            pass
+            self._last_duty = None
         self.active = True
         return 0  # voice_id for mono
 
     def note_off(self, voice_id=None, *, pitch=None, now_ms: int = 0):
-        if self.voice and not self.voice["released"]:
-            self.voice["released"] = True
-            self.voice["t_release"] = int(now_ms)
+        v = self.voice
+        if v and not v.released:
+            v.released = True
+            v.t_release = int(now_ms)
 
     def all_notes_off(self):
         self.voice = None
         self.active = False
+        self._last_duty = None
         try:
             self.pwm.stop()
         except Exception:
             pass
 
     def play_event(self, event, now_ms: int = 0):
-        dur = getattr(event, "duration_ms", None) if hasattr(event, "duration_ms") else None
-        vel = getattr(event, "magnitude", getattr(event, "velocity", 1.0))
+        # NoteEvent always carries magnitude/duration_ms; other event types may use velocity
+        try:
+            vel = event.magnitude
+        except AttributeError:
+            vel = getattr(event, "velocity", 1.0)
+        dur = getattr(event, "duration_ms", None)
         return self.note_on(event.pitch, velocity=vel, duration_ms=dur, now_ms=now_ms)
 
+    def needs_tick(self) -> bool:
+        """False while silent, so callers can skip tick() entirely."""
+        return self.active
+
     def tick(self, now_ms: int):
-        """Advance envelope and update PWM duty. Call every ~10 ms."""
+        """Advance envelopes, then flush() once to update PWM duty. Call every ~10 ms."""
         v = self.voice
         if not v:
             return
 
-        e = self.env
-        t = max(0, int(now_ms) - v["t0"])
+        t = max(0, int(now_ms) - v.t0)
 
         # auto duration -> trigger release
-        if v["duration_ms"] is not None and (not v["released"]) and t >= v["duration_ms"]:
-            v["released"] = True
-            v["t_release"] = int(now_ms)
+        if v.duration_ms is not None and (not v.released) and t >= v.duration_ms:
+            v.released = True
+            v.t_release = int(now_ms)
 
         # envelope
-        if not v["released"]:
-            # Attack
-            if e["attack_ms"] <= 0:
-                level = 1.0
-            else:
-                level = min(1.0, t / float(e["attack_ms"]))
-            # Decay toward sustain after attack
-            if level >= 1.0:
-                td = t - e["attack_ms"]
-                if e["decay_ms"] <= 0:
-                    level = e["sustain"]
-                else:
-                    td = max(0, td)
-                    start, end = 1.0, e["sustain"]
-                    # linear decay
-                    level = end + (start - end) * max(0.0, 1.0 - td / float(e["decay_ms"]))
-                    if td >= e["decay_ms"]:
-                        level = end
-            v["level"] = level
+        if not v.released:
+            v.level = _env_level(t, self._attack_ms, self._inv_attack,
+                                    self._decay_ms, self._inv_decay, self._sustain)
         else:
             # Release
-            if e["release_ms"] <= 0:
+            if self._release_ms <= 0:
                 self.all_notes_off()
                 return
-            tr = max(0, int(now_ms) - int(v["t_release"]))
-            start = v.get("level", e["sustain"])
-            level = max(0.0, start * (1.0 - tr / float(e["release_ms"])))
-            v["level"] = level
-            if tr >= e["release_ms"] or level <= 0.0:
+            tr = max(0, int(now_ms) - v.t_release)
+            level = max(0.0, v.level * (1.0 - tr * self._inv_release))
+            v.level = level
+            if tr >= self._release_ms or level <= 0.0:
                 self.all_notes_off()
                 return
 
-        # apply duty (clamped)
-        duty = max(0.0, min(1.0, v["level"] * v["vel"] * self.master))
+        self._dirty = True
+        self.flush()
+
+    def flush(self):
+        """Mix the active voices and submit a single PWM duty write for this tick."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        v = self.voice
+        if not v:
+            return
+        mix = v.level * v.vel  # sum over active voices (mono for v1)
+        duty = _clamp01(mix * self.master)
+        last = self._last_duty
+        if last is not None and -_DUTY_LSB < duty - last < _DUTY_LSB:
+            return  # e.g. sustain: same duty as last tick, skip the register write
         try:
             self.pwm.set_duty(duty)
+            self._last_duty = duty
         except Exception:
             self.all_notes_off()
 
     # Debug helper for tests
     def debug_active_voices(self):
-        return [] if not self.voice else [{
-            "voice_id": 0, "pitch": self.voice["pitch"], "freq": self.voice["freq"],
-            "level": self.voice["level"], "released": self.voice["released"]
+        v = self.voice
+        return [] if not v else [{
+            "voice_id": 0, "pitch": v.pitch, "freq": v.freq,
+            "level": v.level, "released": v.released
         }]
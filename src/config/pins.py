@@ -2,18 +2,21 @@
 pins.py — central config for pins and HAL tunables.
 - Single source of truth for wiring and 'knobs' (no `machine` imports here).
 - If wiring changes, update values here — not in drivers.
+- Integer knobs are const() so the MicroPython compiler can fold them;
+  frozen into firmware via /manifest.py.
 """
+from micropython import const
 
 # === Execution mode (app can override for laptop simulation) ===
 SIMULATION = False  # True → use fake drivers on laptop; False → Pico hardware
 
 # === Pin map (Raspberry Pi Pico 2WH) ===
-PIN_LDR_ADC = 28     # GP28 (ADC2) — light sensor
-PIN_BUZZER  = 15     # GP15 (PWM)  — piezo buzzer
+PIN_LDR_ADC = const(28)     # GP28 (ADC2) — light sensor
+PIN_BUZZER  = const(15)     # GP15 (PWM)  — piezo buzzer
 
-PIN_LED_R   = 1     # red led
-PIN_LED_G   = 2     # green led
-PIN_LED_B   = 3     #blue led
+PIN_LED_R   = const(1)     # red led
+PIN_LED_G   = const(2)     # green led
+PIN_LED_B   = const(3)     #blue led
 
 LED_ACTIVE_HIGH = False  #rgb is common-anode   
 
@@ -24,21 +27,21 @@ LED_ACTIVE_HIGH = False  #rgb is common-anode
 # - ADC_SAMPLES: more samples → less noise, more CPU
 # - EMA_ALPHA  : lower → smoother but slower response
 # - MEDIAN_WIN : 3 enables a small spike-killing median; 1 disables
-ADC_SAMPLES = 4
+ADC_SAMPLES = const(4)
 EMA_ALPHA   = 0.30
-MEDIAN_WIN  = 1
+MEDIAN_WIN  = const(1)
 
 
 
 # Two-point calibration placeholders (raw 16-bit ADC range 0..65535)
 # Can overwrite these later from a calibration script (dark / bright).
-RAW_DARK_DEFAULT   = 0
-RAW_BRIGHT_DEFAULT = 65535
+RAW_DARK_DEFAULT   = const(0)
+RAW_BRIGHT_DEFAULT = const(65535)
 
 
 # === Loop timing target (used by app/orchestrator) ===
-LOOP_PERIOD_MS = 10    # control loop tick; ties to CPU < 25% goal
-BTN_DEBOUNCE_MS = 30   #debounce
+LOOP_PERIOD_MS = const(10)    # control loop tick; ties to CPU < 25% goal
+BTN_DEBOUNCE_MS = const(30)   #debounce
 
 
 # === Audio defaults/bounds (used by hal/pwm_audio.py & audio layers) ===
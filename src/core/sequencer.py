@@ -7,8 +7,39 @@ except Exception:
     def ticks_ms(): return int(monotonic_ns() // 1_000_000)
     def ticks_diff(a, b): return a - b
 
+from array import array
+from micropython import const
+import micropython
+
+_IDLE = const(0)
+_RECORDING = const(1)
+_PLAYING = const(2)
+
+try:
+    from bisect import bisect_right
+except ImportError:
+    # MicroPython ships without bisect: search the raw int32 buffer instead
+    @micropython.viper
+    def _bisect_right_i32(buf: ptr32, n: int, t: int) -> int:
+        lo = 0
+        hi = n
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if buf[mid] <= t:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def bisect_right(a, x):
+        return _bisect_right_i32(a, len(a), x)
+
 from models.types import NoteEvent
 
+# Column sentinels for NoteEvent fields that may be None
+_NO_PITCH = 255
+_NO_DUR = -1
+
 class Sequencer:
     """
     States: IDLE -> RECORDING -> PLAYING
@@ -17,14 +48,15 @@ class Sequencer:
     - Matches Pat's Controller/Storage expectations.
     """
 
-    IDLE, RECORDING, PLAYING = 0, 1, 2
+    IDLE, RECORDING, PLAYING = _IDLE, _RECORDING, _PLAYING  # aliases for external callers
 
     def __init__(self, bpm=120, quantize_ms=0, beats_per_bar=4, channels=1):
-        self._state = self.IDLE
-        self._events: list[NoteEvent] = []
-        self._bpm = int(bpm)
+        self._state = _IDLE
+        # Events stored column-wise (SoA), sorted by timestamp
+        self._clear_events()
         self._quantize_ms = max(0, int(quantize_ms))
         self._beats_per_bar = max(1, int(beats_per_bar))
+        self.set_bpm(bpm)  # also derives _beat_ms_v / _bar_ms_v
         self._channels = int(channels)
 
         # rec
@@ -35,118 +67,223 @@ class Sequencer:
         self._play_t0_ms: int | None = None
         self._last_tick_ms: int | None = None
         self._play_idx = 0
+        self._last_t_in: int | None = None  # loop position at the previous tick (None = seek)
+        self._out_buf: list[NoteEvent] = []  # reused by tick()
         self._track_len_ms = 0
 
     # -------- Controller-required API --------
     def start_recording(self):  # used by Controller
         self.stop_playback()
-        self._events.clear()
+        self._clear_events()
         self._rec_t0_ms = ticks_ms()
-        self._state = self.RECORDING
+        self._state = _RECORDING
         self._track_len_ms = 0
 
     def stop_recording(self):   # used by Controller
-        if self._state != self.RECORDING:
+        if self._state != _RECORDING:
             return
-        self._state = self.IDLE
-        last_t = self._events[-1].timestamp_ms if self._events else 0
-        bar = self._beat_ms() * self._beats_per_bar
-        self._track_len_ms = _round_up(last_t, bar) if self._loop else last_t
+        self._state = _IDLE
+        last_t = self._t[-1] if self._t else 0
+        self._track_len_ms = _round_up(last_t, self._bar_ms_v) if self._loop else last_t
 
     def start_playback(self, loop=True):  # used by Controller
         self._loop = bool(loop)
         self._play_idx = 0
+        self._last_t_in = None
         self._play_t0_ms = ticks_ms()
         self._last_tick_ms = self._play_t0_ms
         if self._track_len_ms <= 0:
-            self._track_len_ms = self._events[-1].timestamp_ms if self._events else 0
-        self._state = self.PLAYING
+            self._track_len_ms = self._t[-1] if self._t else 0
+        self._state = _PLAYING
 
     def stop_playback(self):  # used by Controller
-        if self._state == self.PLAYING:
-            self._state = self.IDLE
+        if self._state == _PLAYING:
+            self._state = _IDLE
         self._play_t0_ms = None
         self._last_tick_ms = None
         self._play_idx = 0
+        self._last_t_in = None
 
     def panic_all_notes_off(self):  # used by Controller
         # No synth dependency here; ensure playback halted
         self.stop_playback()
 
     def has_content(self) -> bool:  # used by Controller
-        return len(self._events) > 0
+        return len(self._t) > 0
 
     def get_bpm(self) -> int:       # used by Controller/Storage
         return self._bpm
 
+    def set_bpm(self, bpm) -> None:
+        self._bpm = int(bpm)
+        # Derived timing, recomputed here rather than on every use
+        self._beat_ms_v = 60000 // max(1, self._bpm)
+        self._bar_ms_v = self._beat_ms_v * self._beats_per_bar
+
     def get_channels(self) -> int:  # used by Controller/Storage
         return self._channels
 
     def export_events_rows(self) -> list:  # used by Storage
-        return [e.to_row() for e in self._events]
+        return [self._event_at(i).to_row() for i in range(len(self._t))]
 
     def import_events_rows(self, rows: list):  # used by Storage
-        self._events = [NoteEvent.from_row(r) for r in rows]
+        # Rows go straight into fresh columns (no NoteEvent per stored row), swapped
+        # in only once every row has been coerced: a bad row leaves the old take intact
+        t_col, ch_col, pitch_col = array('i'), array('B'), array('B')
+        mag_col, dur_col = array('f'), array('i')
+        for t, ch, mag, pitch, dur in rows:
+            t, ch, mag, pitch, dur = _column_row(t, ch, mag, pitch, dur)
+            t_col.append(t)
+            ch_col.append(ch)
+            pitch_col.append(pitch)
+            mag_col.append(mag)
+            dur_col.append(dur)
+        self._t, self._ch, self._pitch, self._mag, self._dur = t_col, ch_col, pitch_col, mag_col, dur_col
         # recompute track length
-        self._track_len_ms = self._events[-1].timestamp_ms if self._events else 0
-        self._state = self.IDLE
+        self._track_len_ms = self._t[-1] if self._t else 0
+        self._state = _IDLE
         self._play_idx = 0
+        self._last_t_in = None
 
     # -------- Recording hook from Signal layer --------
     def record_event(self, event: NoteEvent) -> None:
-        if self._state != self.RECORDING or self._rec_t0_ms is None:
+        if self._state != _RECORDING or self._rec_t0_ms is None:
+            return
+        # The columns copy the fields, so no NoteEvent is allocated per recorded note
+        t = int(ticks_diff(ticks_ms(), self._rec_t0_ms))
+        q = self._quantize_ms
+        if q > 0:
+            t = (t + (q >> 1)) // q * q  # _quantize(), inlined
+        # Live input arrives in order; only a quantized-down stamp needs a search
+        row = _column_row(t, event.channel, event.magnitude, event.pitch, event.duration_ms)
+        times = self._t
+        i = len(times)
+        if i and t < times[-1]:
+            i = _insert_pos(times, t)
+        self._insert_row(i, row)
+
+    def record_events(self, events) -> None:
+        """
+        Record several events that arrived together (e.g. a chord).
+        Same result as record_event() per event, but the timestamp and insert
+        position are computed once and late rows are spliced in one pass
+        instead of shifting the columns once per event.
+        """
+        if self._state != _RECORDING or self._rec_t0_ms is None:
             return
-        rel = ticks_diff(ticks_ms(), self._rec_t0_ms)
-        e = NoteEvent(event.channel, int(rel), event.magnitude, event.pitch, event.duration_ms)
+        t = int(ticks_diff(ticks_ms(), self._rec_t0_ms))
         if self._quantize_ms > 0:
-            e.timestamp_ms = _quantize(e.timestamp_ms, self._quantize_ms)
-        if not self._events or e.timestamp_ms >= self._events[-1].timestamp_ms:
-            self._events.append(e)
+            t = _quantize(t, self._quantize_ms)
+        # validate the whole batch first: a bad event must not strand the split-off tails
+        rows = [_column_row(t, ev.channel, ev.magnitude, ev.pitch, ev.duration_ms) for ev in events]
+        i = _insert_pos(self._t, t)
+        tails = None
+        if i < len(self._t):
+            cols = (self._t, self._ch, self._pitch, self._mag, self._dur)
+            tails = [c[i:] for c in cols]
+            self._t, self._ch, self._pitch, self._mag, self._dur = [c[:i] for c in cols]
+        for row in rows:
+            self._insert_row(len(self._t), row)
+        if tails:
+            for c, tail in zip((self._t, self._ch, self._pitch, self._mag, self._dur), tails):
+                c.extend(tail)
+
+    # -------- SoA event storage --------
+    def _clear_events(self):
+        self._t = array('i')      # timestamp_ms
+        self._ch = array('B')     # channel
+        self._pitch = array('B')  # pitch (_NO_PITCH for None)
+        self._mag = array('f')    # magnitude
+        self._dur = array('i')    # duration_ms (_NO_DUR for None)
+
+    def _insert_row(self, i, row):
+        """Insert a _column_row() tuple at row i of every column (append when i == len)."""
+        t, ch, mag, pitch, dur = row
+        if i == len(self._t):
+            self._t.append(t)
+            self._ch.append(ch)
+            self._pitch.append(pitch)
+            self._mag.append(mag)
+            self._dur.append(dur)
         else:
-            i = _bisect_right_by_time(self._events, e.timestamp_ms)
-            self._events.insert(i, e)
+            _array_insert(self._t, i, t)
+            _array_insert(self._ch, i, ch)
+            _array_insert(self._pitch, i, pitch)
+            _array_insert(self._mag, i, mag)
+            _array_insert(self._dur, i, dur)
+
+    def _event_at(self, i) -> NoteEvent:
+        """Materialize row i as a NoteEvent (only done for events handed out)."""
+        pitch = self._pitch[i]
+        dur = self._dur[i]
+        return NoteEvent._from_trusted(self._ch[i], self._t[i], self._mag[i],
+                                       None if pitch == _NO_PITCH else pitch,
+                                       None if dur == _NO_DUR else dur)
 
     # -------- Playback scheduling (call ~every 5–15ms) --------
-    def tick(self, now_ms: int | None = None) -> list[NoteEvent]:
-        if self._state != self.PLAYING or self._play_t0_ms is None:
-            return []
-        now = ticks_ms() if now_ms is None else int(now_ms)
+    @micropython.native
+    def tick(self, now_ms: int | None = None, _tm=ticks_ms, _td=ticks_diff) -> list[NoteEvent]:
+        """
+        Return the events due since the previous tick.
+        The list is reused: consume it before calling tick() again.
+        """
+        out = self._out_buf
+        out.clear()
+        t0 = self._play_t0_ms
+        if self._state != _PLAYING or t0 is None:
+            return out
+        now = _tm() if now_ms is None else int(now_ms)
 
         prev_tick = self._last_tick_ms if self._last_tick_ms is not None else now
         self._last_tick_ms = now
 
-        if not self._events:
-            if self._loop and self._track_len_ms > 0:
-                elapsed = ticks_diff(now, self._play_t0_ms)
-                if elapsed >= self._track_len_ms:
-                    loops = elapsed // self._track_len_ms
-                    self._play_t0_ms += loops * self._track_len_ms
-            return []
-
-        out: list[NoteEvent] = []
-        elapsed = ticks_diff(now, self._play_t0_ms)
-
-        if self._loop and self._track_len_ms > 0:
-            t_in = elapsed % self._track_len_ms
-            prev_in = ticks_diff(prev_tick, self._play_t0_ms) % self._track_len_ms
-            if t_in >= prev_in:
-                s = _bisect_right_by_time(self._events, prev_in)
-                e = _bisect_right_by_time(self._events, t_in)
-                out.extend(self._events[s:e])
-            else:
-                s = _bisect_right_by_time(self._events, prev_in)
-                out.extend(self._events[s:])
-                e = _bisect_right_by_time(self._events, t_in)
-                out.extend(self._events[:e])
-            self._play_idx = _bisect_right_by_time(self._events, t_in)
+        times = self._t
+        n = len(times)
+        track_len = self._track_len_ms
+        loop = self._loop
+        elapsed = _td(now, t0)
+        if not n:
+            if loop and track_len > 0 and elapsed >= track_len:
+                self._play_t0_ms = t0 + (elapsed // track_len) * track_len
+            return out
+
+        i = self._play_idx
+
+        if loop and track_len > 0:
+            # elapsed stays below track_len: t0 is moved up a loop on every wrap
+            t_in = elapsed if elapsed < track_len else elapsed % track_len
+            prev_in = self._last_t_in
+            if prev_in is None:
+                # first tick after start: place the cursor once
+                prev_in = _td(prev_tick, t0) % track_len
+                i = bisect_right(times, prev_in)
+            self._last_t_in = t_in
+
+            # fast path (most ticks): no wrap and the next event is not due yet
+            if t_in >= prev_in and (i >= n or times[i] > t_in):
+                self._play_idx = i
+                return out
+
+            # i is the first event after prev_in; advance it linearly
+            if t_in < prev_in:
+                # wrapped: drain (prev_in, end] then restart from the top
+                while i < n:
+                    out.append(self._event_at(i))
+                    i += 1
+                i = 0
+                self._play_t0_ms = t0 + (elapsed - t_in)
+            while i < n and times[i] <= t_in:
+                out.append(self._event_at(i))
+                i += 1
+            self._play_idx = i
             return out
 
         # non-looping
-        n = len(self._events)
-        while self._play_idx < n and self._events[self._play_idx].timestamp_ms <= elapsed:
-            out.append(self._events[self._play_idx])
-            self._play_idx += 1
-        if self._play_idx >= n and not self._loop:
+        while i < n and times[i] <= elapsed:
+            out.append(self._event_at(i))
+            i += 1
+        self._play_idx = i
+        if i >= n and not loop:
             self.stop_playback()
         return out
 
@@ -154,29 +291,66 @@ class Sequencer:
     def summary(self) -> dict:
         return {
             "state": self._state, "bpm": self._bpm, "quantize_ms": self._quantize_ms,
-            "beats_per_bar": self._beats_per_bar, "events": len(self._events),
+            "beats_per_bar": self._beats_per_bar, "events": len(self._t),
             "track_len_ms": self._track_len_ms, "loop": self._loop,
         }
 
     def _beat_ms(self) -> int:
-        return int(60000 // max(1, self._bpm))
+        return self._beat_ms_v
 
 
 # ---- helpers ----
-def _quantize(t_ms, q_ms):
-    if q_ms <= 0: return int(t_ms)
-    return int((t_ms + q_ms // 2) // q_ms) * q_ms
-
-def _round_up(val, base):
-    if base <= 0: return int(val)
-    return int(((val + base - 1) // base) * base)
-
-def _bisect_right_by_time(events, t_ms):
-    lo, hi = 0, len(events)
-    while lo < hi:
-        mid = (lo + hi) // 2
-        if events[mid].timestamp_ms <= t_ms:
-            lo = mid + 1
-        else:
-            hi = mid
-    return lo
+@micropython.viper
+def _quantize(t_ms: int, q_ms: int) -> int:
+    if q_ms <= 0: return t_ms
+    return ((t_ms + (q_ms >> 1)) // q_ms) * q_ms
+
+@micropython.viper
+def _round_up(val: int, base: int) -> int:
+    if base <= 0: return val
+    return ((val + base - 1) // base) * base
+
+def _column_row(t, ch, mag, pitch, dur):
+    """
+    Coerce one event to its column values (None -> sentinel) and range-check it,
+    so a bad field raises ValueError before any column is touched.
+    """
+    t = int(t)
+    ch = int(ch)
+    mag = float(mag)
+    if pitch is None:
+        pitch = _NO_PITCH
+    else:
+        pitch = int(pitch)
+        if not 0 <= pitch < _NO_PITCH:
+            raise ValueError("pitch out of range 0..254")
+    if dur is None:
+        dur = _NO_DUR
+    else:
+        dur = int(dur)
+        if not 0 <= dur <= 0x7FFFFFFF:
+            raise ValueError("duration_ms out of range")
+    if not -0x80000000 <= t <= 0x7FFFFFFF:
+        raise ValueError("timestamp_ms out of range")
+    if not 0 <= ch <= 255:
+        raise ValueError("channel out of range 0..255")
+    return t, ch, mag, pitch, dur
+
+_TAIL_SCAN = 8  # late (quantized) events land within a few slots of the end
+
+@micropython.native
+def _insert_pos(times, t):
+    """Index after the last timestamp <= t: scan back from the tail, bisect if far."""
+    i = len(times)
+    stop = i - _TAIL_SCAN if i > _TAIL_SCAN else 0
+    while i > stop:
+        if times[i - 1] <= t:
+            return i
+        i -= 1
+    return bisect_right(times, t) if i else 0
+
+def _array_insert(arr, i, v):
+    # MicroPython arrays have no insert(): grow by one and shift the tail
+    arr.append(v)
+    arr[i + 1:] = arr[i:-1]
+    arr[i] = v
@@ -12,6 +12,8 @@ Notes:
 
 from config.pins import PIN_LDR_ADC, ADC_SAMPLES
 
+_INV_ADC_MAX = 1.0 / 65535.0  # raw 16-bit -> 0.0..1.0 (multiply, don't divide)
+
 
 # Try MicroPython hardware; if unavailable (laptop), keep import safe
 #import and environment guard
@@ -49,6 +51,17 @@ class ADCReader:
 
         # On Pico: construct ADC on the given GPIO pin (0..65535 reads)
         self._adc = ADC(adc_pin)
+        self._read_u16 = self._adc.read_u16  # bound once, not per sample
+        self._scale = _INV_ADC_MAX / self.samples  # sum -> 0.0..1.0 in one multiply
+
+
+    def _sum_raw(self) -> int:
+        """Sum of `samples` raw read_u16() values (not yet averaged)."""
+        r = self._read_u16
+        total = 0
+        for _ in range(self.samples):
+            total += r()
+        return total
 
 
     def read_raw(self) -> int:
@@ -56,14 +69,11 @@ class ADCReader:
         calls read_u16()several times and averages them.
         averaging smooths noise a bit with very little cpu cost
         """
-        total = 0
-        for _ in range(self.samples):
-            total += self._adc.read_u16()
-        return total // self.samples
+        return self._sum_raw() // self.samples
 
 
     def read_norm(self) -> float:
         """Return normalized light level in [0.0, 1.0].
         converts the 16bit value to a 0.0-1.0 float so other modules can use it directly
         """
-        return self.read_raw() / 65535.0
+        return self._sum_raw() * self._scale
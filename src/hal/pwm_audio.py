@@ -4,6 +4,7 @@ PWMAudio — minimal PWM tone driver (Pico 2WH, GP16 by default).
 
 Public API (MVP):
     play_tone(freq_hz: float, duration_ms: int, volume: float = TONE_DUTY) -> None
+    emit_tone(freq_hz: float, volume: float = TONE_DUTY) -> None   (no timing)
 
 Notes:
 - Uses pin/bounds from config.pins (no hard-coding).
@@ -31,6 +32,9 @@ except Exception:
     import time
     _MICROPY = False
 
+# Multiplies every tone duration before sleeping; laptop tests set 0.0 instead of
+# swapping out time.sleep_ms, so the real sleep call stays on the tested path
+_SLEEP_SCALE = 1.0
 
 class PWMAudio:
     def __init__(self, pin_num: int = PIN_BUZZER):
@@ -45,6 +49,7 @@ class PWMAudio:
         self._pwm = PWM(Pin(pin_num))
         self._pwm.duty_u16(0)  # ensure silent on init
         self._freq = 0         # NEW: track active frequency
+        self._duty16 = 0       # last duty_u16 written (skip identical writes)
         self._active = False   # NEW: track active state
 
 
@@ -54,19 +59,35 @@ class PWMAudio:
         if frequency is None or frequency <= 0:
             self.stop()
             return
-        f = max(MIN_TONE_HZ, min(MAX_TONE_HZ, float(frequency)))
-        self._pwm.freq(int(f))
-        self._freq = int(f)
+        f = float(frequency)
+        if f < MIN_TONE_HZ:
+            f = MIN_TONE_HZ
+        elif f > MAX_TONE_HZ:
+            f = MAX_TONE_HZ
+        f = int(f)
         if not self._active:
-            self._pwm.duty_u16(0)  # start silent
+            self._pwm.duty_u16(0)  # start silent (pop-safe: before the freq change)
+            self._duty16 = 0
             self._active = True
+        elif f == self._freq:
+            return  # unchanged: skip the PWM divider reconfiguration
+        self._pwm.freq(f)
+        self._freq = f
 
     def set_duty(self, duty_cycle_0_1: float) -> None:
         """Set duty (volume) in 0..1 non-blocking."""
         if not self._active:
             return
-        d = max(0.0, min(1.0, float(duty_cycle_0_1)))
-        self._pwm.duty_u16(int(65535 * d))
+        d = float(duty_cycle_0_1)
+        if d >= 1.0:
+            d16 = 65535
+        elif d > 0.0:
+            d16 = int(65535 * d)
+        else:
+            d16 = 0
+        if d16 != self._duty16:
+            self._pwm.duty_u16(d16)
+            self._duty16 = d16
 
     def stop(self) -> None:
         """Silence output (non-blocking)."""
@@ -75,6 +96,7 @@ class PWMAudio:
         finally:
             self._active = False
             self._freq = 0
+            self._duty16 = 0
 
 
     # --- Original blocking API (unchanged interface) ---
@@ -87,7 +109,24 @@ class PWMAudio:
         """
         if freq_hz <= 0 or duration_ms <= 0:
             return
-        
+        self._start_tone(freq_hz, volume)
+
+        #blocks for the request duration
+        time.sleep_ms(int(duration_ms * _SLEEP_SCALE))
+        self.stop()            # NEW: reuse non-blocking API
+
+    def emit_tone(self, freq_hz: float, volume: float = TONE_DUTY) -> None:
+        """
+        Same PWM writes as play_tone() (duty→0, freq, duty, duty→0) with no
+        duration in between; lets laptop tests check order/clamping without
+        going anywhere near time.sleep_ms. non positive frequency = no-op
+        """
+        if freq_hz <= 0:
+            return
+        self._start_tone(freq_hz, volume)
+        self.stop()
+
+    def _start_tone(self, freq_hz: float, volume: float) -> None:
         # clamp inputs
         volume = max(0.0, min(1.0, float(volume)))
         f = max(MIN_TONE_HZ, min(MAX_TONE_HZ, float(freq_hz)))
@@ -98,9 +137,31 @@ class PWMAudio:
         self.set_freq(f)       # NEW: reuse non-blocking API
         self.set_duty(volume)  # NEW: reuse non-blocking API
 
-        #blocks for the request duration
-        time.sleep_ms(int(duration_ms))
-        self.stop()            # NEW: reuse non-blocking API
+
+    def play_tones(self, events) -> None:
+        """
+        Play a run of (freq_hz, duration_ms, volume) tones back to back (blocking).
+        Same pop-safe order and clamping as play_tone(), but the PWM methods and
+        sleep are bound once for the whole batch instead of per note.
+        invalid entries (non positive frequency/duration) are skipped
+        """
+        pwm = self._pwm
+        set_freq = pwm.freq
+        set_duty = pwm.duty_u16
+        sleep_ms = time.sleep_ms
+        lo, hi = MIN_TONE_HZ, MAX_TONE_HZ
+        scale = _SLEEP_SCALE
+        try:
+            for f, d, v in events:
+                if f <= 0 or d <= 0:
+                    continue
+                set_duty(0)
+                set_freq(int(max(lo, min(hi, float(f)))))
+                set_duty(int(65535 * max(0.0, min(1.0, float(v)))))
+                sleep_ms(int(d * scale))
+                set_duty(0)
+        finally:
+            self.stop()
 
 
     # --- NEW optional cleanup ---
@@ -1,7 +1,19 @@
 # integration/audio_storage_bridge.py
 # Bridge between storage and audio (synth/HAL) for laptop + Pico.
 
-import os, json
+import os
+import math
+
+try:
+    import ujson as json
+except Exception:
+    import json
+
+# Optional C encoder on the laptop (pip install orjson); stdlib/ujson otherwise
+try:
+    import orjson as _json_fast
+except ImportError:
+    _json_fast = None
 
 # ---------- Minimal portable storage (JSON-on-disk) ----------
 class DefaultStorage:
@@ -15,17 +27,41 @@ class DefaultStorage:
         return os.path.join(self.base_dir, f"{safe}.json")
 
     def save_json(self, name: str, data: dict) -> None:
+        if _json_fast is not None:
+            with open(self._path(name), "wb") as f:
+                f.write(_json_fast.dumps(data, option=_json_fast.OPT_INDENT_2))
+            return
         with open(self._path(name), "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
 
+    def save_json_stream(self, name: str, chunks) -> None:
+        """Write pre-encoded JSON text chunk by chunk (no whole-document string).
+        Goes through a temp file, so a chunk that raises leaves the old file in place."""
+        path = self._path(name)
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        except Exception:
+            os.remove(tmp)
+            raise
+        _replace(tmp, path)
+
     def load_json(self, name: str) -> dict:
         p = self._path(name)
         if not os.path.exists(p):
             raise FileNotFoundError(p)
+        if _json_fast is not None:
+            with open(p, "rb") as f:
+                return _json_fast.loads(f.read())
         with open(p, "r", encoding="utf-8") as f:
             return json.load(f)
 
 
+_replace = getattr(os, "replace", os.rename)  # MicroPython's os has rename only
+
+
 # ---------- Synth settings I/O ----------
 def save_synth_settings(storage, name: str, synth) -> None:
     """Persist envelope + master volume from audio/synth.Synth."""
@@ -61,16 +97,39 @@ def load_synth_settings(storage, name: str, synth) -> None:
 # ---------- Sequence I/O (list of {pitch, velocity, duration_ms}) ----------
 def save_sequence(storage, name: str, events: list) -> None:
     """Persist a list of note dicts: {pitch, velocity, duration_ms}."""
+    if hasattr(storage, "save_json_stream"):
+        storage.save_json_stream(name, _sequence_chunks(events))
+        return
     norm = []
     for ev in events:
         norm.append({
             "pitch": int(ev["pitch"]),
-            "velocity": float(ev.get("velocity", 1.0)),
+            "velocity": _velocity(ev),
             "duration_ms": int(ev.get("duration_ms", 200)),
         })
     storage.save_json(name, {"type": "note_sequence", "events": norm})
 
 
+def _sequence_chunks(events):
+    """Encode a note_sequence blob one event at a time (O(1) extra memory)."""
+    yield '{"type": "note_sequence", "events": ['
+    sep = ""
+    for ev in events:
+        yield '%s{"pitch": %d, "velocity": %r, "duration_ms": %d}' % (
+            sep, int(ev["pitch"]), _velocity(ev),  # finite, so %r is valid JSON
+            int(ev.get("duration_ms", 200)))
+        sep = ", "
+    yield "]}"
+
+
+def _velocity(ev) -> float:
+    """Event velocity as a float; NaN/inf have no JSON spelling, so they are rejected."""
+    v = float(ev.get("velocity", 1.0))
+    if not math.isfinite(v):
+        raise ValueError("velocity must be finite")
+    return v
+
+
 def load_sequence(storage, name: str) -> list:
     """Load a note sequence previously saved by save_sequence()."""
     data = storage.load_json(name)
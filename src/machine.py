@@ -2,6 +2,7 @@
 # NOTE: On the Pico you will NOT use this file; the real 'machine' module exists there.
 
 import random
+import threading
 
 class Pin:
     IN = 0
@@ -43,3 +44,30 @@ class PWM:
 
     def deinit(self):
         self.calls.append(("deinit", None))
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, *args, **kwargs):
+        self._stop = None
+
+    # Callbacks fire from a daemon thread so desktop runs still get them
+    def init(self, *, mode=PERIODIC, period=1000, callback=None, **kwargs):
+        self.deinit()
+        stop = self._stop = threading.Event()
+
+        def _loop():
+            while not stop.wait(period / 1000.0):
+                if callback is not None:
+                    callback(self)
+                if mode == Timer.ONE_SHOT:
+                    break
+
+        threading.Thread(target=_loop, daemon=True).start()
+
+    def deinit(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
@@ -0,0 +1,20 @@
+# micropython.py — desktop shim so CPython can import MicroPython-style code.
+# NOTE: On the Pico you will NOT use this file; the real 'micropython' module is built in.
+# Emitter decorators (@micropython.native / @micropython.viper) become pass-throughs here.
+
+
+def const(value):
+    return value
+
+
+def native(fn):
+    return fn
+
+
+def viper(fn):
+    return fn
+
+
+# No IRQ context on the desktop: run the callback right away
+def schedule(fn, arg):
+    fn(arg)
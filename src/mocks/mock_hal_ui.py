@@ -1,11 +1,22 @@
 # mocks/mock_hal_ui.py
+_BITS = {"REC": 1, "PLAY": 2, "ERR": 4, "SAVE": 8, "LOAD": 16}
+
 class MockUI:
     def __init__(self):
-        self.led = {"REC": False, "PLAY": False, "ERR": False, "SAVE": False, "LOAD": False}
+        self._leds = 0  # one bit per LED (see _BITS)
         self.log = []  # (action, name, value)
 
+    @property
+    def led(self) -> dict:
+        """LED states as {name: bool} (snapshot of the bitfield)."""
+        leds = self._leds
+        return {name: bool(leds & bit) for name, bit in _BITS.items()}
+
     def set_led(self, name: str, on: bool):
-        self.led[name] = bool(on)
+        if on:
+            self._leds |= _BITS[name]
+        else:
+            self._leds &= ~_BITS[name]
         self.log.append(("LED", name, on))
 
     def flash(self, name: str, times: int = 1):
@@ -1,9 +1,50 @@
 # mocks/mock_sequencer.py
+from array import array
+
 from models.types import NoteEvent
 
+# Column sentinels for NoteEvent fields that may be None (same as core.sequencer)
+_NO_PITCH = 255
+_NO_DUR = -1
+
+def _insert_pos(times, t):
+    """Index after the last timestamp <= t (scan from the tail: in-order input is O(1))."""
+    i = len(times)
+    while i and times[i - 1] > t:
+        i -= 1
+    return i
+
+def _column_row(t, ch, mag, pitch, dur):
+    """Coerce one row to column values (None -> sentinel); ValueError if a field won't fit."""
+    t, ch, mag = int(t), int(ch), float(mag)
+    if pitch is None:
+        pitch = _NO_PITCH
+    else:
+        pitch = int(pitch)
+        if not 0 <= pitch < _NO_PITCH:
+            raise ValueError("pitch out of range 0..254")
+    if dur is None:
+        dur = _NO_DUR
+    else:
+        dur = int(dur)
+        if not 0 <= dur <= 0x7FFFFFFF:
+            raise ValueError("duration_ms out of range")
+    if not -0x80000000 <= t <= 0x7FFFFFFF:
+        raise ValueError("timestamp_ms out of range")
+    if not 0 <= ch <= 255:
+        raise ValueError("channel out of range 0..255")
+    return t, ch, mag, pitch, dur
+
+def _array_insert(arr, i, v):
+    # arrays have no insert() on MicroPython: grow by one and shift the tail
+    arr.append(v)
+    arr[i + 1:] = arr[i:-1]
+    arr[i] = v
+
 class MockSequencer:
     def __init__(self):
-        self._events: list[NoteEvent] = []
+        # Events stored column-wise (SoA), like core.sequencer.Sequencer
+        self._clear_events()
         self._recording = False
         self._playing = False
         self._bpm = 120
@@ -15,20 +56,58 @@ class MockSequencer:
     def start_playback(self, loop=True): self._playing = True
     def stop_playback(self): self._playing = False
     def panic_all_notes_off(self): pass
-    def has_content(self) -> bool: return len(self._events) > 0
+    def has_content(self) -> bool: return len(self._t) > 0
     def get_bpm(self) -> int: return self._bpm
     def get_channels(self) -> int: return self._channels
 
     # Storage bridge
     def export_events_rows(self) -> list:
-        return [e.to_row() for e in self._events]
+        # Same rows as NoteEvent.to_row(), straight from the columns
+        return [[t, ch, round(mag, 4),
+                 None if p == _NO_PITCH else p,
+                 None if d == _NO_DUR else d]
+                for t, ch, mag, p, d in zip(self._t, self._ch, self._mag, self._pitch, self._dur)]
 
     def import_events_rows(self, rows: list):
-        self._events = [NoteEvent.from_row(r) for r in rows]
+        # [t, ch, mag, pitch, dur] as in NoteEvent.to_row(); all rows are checked
+        # before the current events are replaced
+        checked = [_column_row(t, ch, mag, pitch, dur) for t, ch, mag, pitch, dur in rows]
+        self._clear_events()
+        for row in checked:
+            self._insert_row(row)
+
+    def add_event(self, e: NoteEvent):
+        """Insert e keeping the columns sorted by timestamp (stable for ties)."""
+        self._insert_row(_column_row(e.timestamp_ms, e.channel, e.magnitude, e.pitch, e.duration_ms))
+
+    def _insert_row(self, row):
+        """Insert a _column_row() tuple (already checked, so no column can fail midway)."""
+        t, ch, mag, pitch, dur = row
+        i = _insert_pos(self._t, t)
+        if i == len(self._t):
+            self._t.append(t)
+            self._ch.append(ch)
+            self._mag.append(mag)
+            self._pitch.append(pitch)
+            self._dur.append(dur)
+        else:
+            _array_insert(self._t, i, t)
+            _array_insert(self._ch, i, ch)
+            _array_insert(self._mag, i, mag)
+            _array_insert(self._pitch, i, pitch)
+            _array_insert(self._dur, i, dur)
+
+    def _clear_events(self):
+        self._t = array('i')      # timestamp_ms
+        self._ch = array('B')     # channel
+        self._pitch = array('B')  # pitch (_NO_PITCH for None)
+        self._mag = array('f')    # magnitude
+        self._dur = array('i')    # duration_ms (_NO_DUR for None)
 
     # Helpers for tests/demo
     def inject_dummy_events(self, n=5, base_t=0):
-        self._events = []
-        for i in range(n):
-            self._events.append(NoteEvent(channel=0, timestamp_ms=base_t + i*250,
-                                          magnitude=0.8, pitch=60+i))
+        self._t = array('i', range(base_t, base_t + n * 250, 250))
+        self._ch = array('B', bytes(n))
+        self._pitch = array('B', range(60, 60 + n))
+        self._mag = array('f', [0.8] * n)
+        self._dur = array('i', [_NO_DUR] * n)
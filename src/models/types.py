@@ -1,8 +1,4 @@
 # models/types.py
-try:
-    import ujson as json  # noqa: F401
-except Exception:
-    import json  # noqa: F401
 
 class NoteEvent:
     __slots__ = ("channel", "timestamp_ms", "magnitude", "pitch", "duration_ms")
@@ -21,5 +17,17 @@ class NoteEvent:
 
     @staticmethod
     def from_row(row):
+        # rows come from disk JSON: coerce like __init__ does
         t, ch, mag, pitch, dur = row
         return NoteEvent(ch, t, mag, pitch, dur)
+
+    @classmethod
+    def _from_trusted(cls, channel, timestamp_ms, magnitude, pitch, duration_ms):
+        # Fields already have the right types (read back from typed arrays): skip __init__'s coercions
+        self = cls.__new__(cls)
+        self.channel = channel
+        self.timestamp_ms = timestamp_ms
+        self.magnitude = magnitude
+        self.pitch = pitch
+        self.duration_ms = duration_ms
+        return self
@@ -6,7 +6,17 @@ try:
 except Exception:
     import json
 
+_dumps = json.dumps
+_loads = json.loads
+
+# Optional C encoder on the laptop (pip install orjson); returns bytes directly
+try:
+    import orjson as _json_fast
+except ImportError:
+    _json_fast = None
+
 import os
+import re
 
 # MicroPython compatibility
 try:
@@ -28,25 +38,26 @@ def _ensure_dir(path: str):
             if hasattr(os, "makedirs"):
                 os.makedirs(path, exist_ok=True)
 
+_UNSAFE_CHAR = re.compile(r"[^A-Za-z0-9_-]")
+
 def _sanitize_name(name: str) -> str:
     # Allow letters, digits, dash, underscore; replace others with underscore.
-    safe = []
-    for c in name.strip():
-        if c.isalnum() or c in ("-", "_"):
-            safe.append(c)
-        else:
-            safe.append("_")
-    out = "".join(safe).strip("_")
+    out = _UNSAFE_CHAR.sub("_", name.strip()).strip("_")
     return out or "untitled"
 
 class PatternStore:
     def __init__(self, base_dir: str = DEFAULT_DIR, max_bytes: int | None = None):
         self.base_dir = base_dir
         self.max_bytes = max_bytes
+        self._path_cache: dict[str, str] = {}  # name -> sanitized file path
         _ensure_dir(self.base_dir)
 
     def _path_for(self, name: str) -> str:
-        return f"{self.base_dir}/{_sanitize_name(name)}.json"
+        p = self._path_cache.get(name)
+        if p is None:
+            p = f"{self.base_dir}/{_sanitize_name(name)}.json"
+            self._path_cache[name] = p
+        return p
 
     def list_patterns(self) -> list[str]:
         try:
@@ -62,6 +73,7 @@ class PatternStore:
 
     def delete(self, name: str) -> None:
         p = self._path_for(name)
+        self._path_cache.pop(name, None)
         try:
             os.remove(p)
         except OSError:
@@ -79,7 +91,10 @@ class PatternStore:
             "metadata": metadata,
             "events": events,  # already in compact row form [[t,ch,mag,pitch,dur], ...]
         }
-        data = json.dumps(payload)
+        if _json_fast is not None:
+            data = _json_fast.dumps(payload)
+        else:
+            data = _dumps(payload).encode()
 
         if self.max_bytes is not None and len(data) > self.max_bytes:
             raise OSError("Pattern too large for storage limit.")
@@ -90,7 +105,7 @@ class PatternStore:
 
         # Safe write: write tmp -> flush -> rename
         try:
-            with open(tmp, "w") as fh:
+            with open(tmp, "wb") as fh:
                 fh.write(data)
                 try:
                     fh.flush()
@@ -129,7 +144,7 @@ class PatternStore:
         except OSError:
             raise FileNotFoundError(f"Pattern '{name}' not found.")
         try:
-            obj = json.loads(txt)
+            obj = _loads(txt)
         except Exception:
             raise IOError("Corrupt pattern file (invalid JSON).")
         # Validate minimally
@@ -11,6 +11,9 @@ PICO_IPS = [
     "192.168.1.101",
 ]
 
+# One pooled session: each note reuses the keep-alive connection to every Pico
+_SESSION = requests.Session()
+
 # --- Music Definition ---
 # Notes mapped to frequencies (in Hz)
 C4 = 262
@@ -55,7 +58,7 @@ def play_note_on_all_picos(freq, ms):
         try:
             # We use a short timeout because we don't need to wait for a response
             # This makes the orchestra play more in sync.
-            requests.post(url, json=payload, timeout=0.1)
+            _SESSION.post(url, json=payload, timeout=0.1)
         except requests.exceptions.Timeout:
             # This is expected, we can ignore it
             pass
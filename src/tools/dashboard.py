@@ -1,6 +1,7 @@
 # dashboard.py
 # To be run on a student's computer (not the Pico)
 
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import time
 
@@ -10,20 +11,33 @@ PICO_IPS = [
     "192.168.1.101",
 ]
 
+# One pooled session: keep-alive connections are reused across refreshes
+_SESSION = requests.Session()
+# Last /health ETag and body per device, for conditional GETs
+_ETAGS = {}
+_HEALTH = {}
+
 
 def get_device_status(ip):
     """Fetches /health and /sensor data from a single device."""
     status = {"ip": ip, "device_id": "N/A", "status": "Error", "norm": 0.0}
     try:
         # Get health status
-        health_res = requests.get(f"http://{ip}/health", timeout=1)
+        etag = _ETAGS.get(ip)
+        headers = {"If-None-Match": etag} if etag else None
+        health_res = _SESSION.get(f"http://{ip}/health", headers=headers, timeout=1)
         health_res.raise_for_status()
-        health_data = health_res.json()
+        if health_res.status_code == 304 and ip in _HEALTH:
+            health_data = _HEALTH[ip]  # unchanged since the last poll
+        else:
+            health_data = health_res.json()
+            _HEALTH[ip] = health_data
+            _ETAGS[ip] = health_res.headers.get("ETag")
         status.update(health_data)
         status["status"] = health_data.get("status", "Unknown")
 
         # Get sensor data
-        sensor_res = requests.get(f"http://{ip}/sensor", timeout=1)
+        sensor_res = _SESSION.get(f"http://{ip}/sensor", timeout=1)
         sensor_res.raise_for_status()
         sensor_data = sensor_res.json()
         status["norm"] = sensor_data.get("norm", 0.0)
@@ -58,10 +72,12 @@ def render_dashboard(statuses):
 
 if __name__ == "__main__":
     try:
-        while True:
-            all_statuses = [get_device_status(ip) for ip in PICO_IPS]
-            render_dashboard(all_statuses)
-            time.sleep(1)  # Refresh every second
+        # Poll all devices concurrently: a refresh costs one timeout, not one per device
+        with ThreadPoolExecutor(max_workers=max(1, len(PICO_IPS))) as pool:
+            while True:
+                all_statuses = list(pool.map(get_device_status, PICO_IPS))
+                render_dashboard(all_statuses)
+                time.sleep(1)  # Refresh every second
 
     except KeyboardInterrupt:
         print("\nDashboard stopped.")
@@ -13,7 +13,13 @@ except Exception:
     import time
     ticks_ms = lambda: int(time.time() * 1000)  # noqa: E731
 
+try:
+    from collections import deque
+except ImportError:
+    from ucollections import deque  # older MicroPython ports
+
 DEBOUNCE_MS = 120
+QUEUE_LEN = 32  # MicroPython deques need a fixed maxlen; presses beyond it are dropped
 
 class Controller:
     """
@@ -22,75 +28,90 @@ class Controller:
     LEDs are logged via ui_backend.set_led(name, on).
     """
 
-    def __init__(self, sequencer, store, ui_backend):
+    POLL_BATCH = 4  # max queued button events handled per poll()
+
+    def __init__(self, sequencer, store, ui_backend, clock=None):
+        """clock: optional ms-timestamp callable (defaults to ticks_ms); tests pass a fake."""
         self.seq = sequencer
         self.store = store
         self.ui = ui_backend
         self.state = "IDLE"  # IDLE | RECORDING | PLAYING | ERROR
         self._last_press_ms = {}
-        self._queue = []  # list of (btn_name, t_ms)
+        self._queue = deque((), QUEUE_LEN)  # FIFO of (btn_name, t_ms)
         self._current_pattern_name = "take1"
+        self._clock = clock or ticks_ms
 
     # --- Mock input injection (for tests/demo) ---
-    def enqueue_button(self, name: str):
-        self._queue.append((name, ticks_ms()))
+    def enqueue_button(self, name: str) -> bool:
+        """Queue a press; returns False (press dropped) while QUEUE_LEN presses are pending.
+        Overflow drops the newest press, so the ones already queued still run in order."""
+        if len(self._queue) >= QUEUE_LEN:
+            return False
+        self._queue.append((name, self._clock()))
+        return True
 
     # --- Poll loop (call periodically) ---
     def poll(self):
-        # drain one event at a time to keep deterministic behavior
-        if not self._queue:
-            return
-        name, t = self._queue.pop(0)
-
-        # debouncing
-        last = self._last_press_ms.get(name, 0)
-        if t - last < DEBOUNCE_MS:
-            return
-        self._last_press_ms[name] = t
-
-        # handle event
+        # drain up to POLL_BATCH events, in order, so bursts don't wait a tick each
+        queue = self._queue
+        for _ in range(self.POLL_BATCH):
+            if not queue:
+                return
+            name, t = queue.popleft()
+
+            # debouncing
+            last = self._last_press_ms.get(name, 0)
+            if t - last < DEBOUNCE_MS:
+                continue
+            self._last_press_ms[name] = t
+
+            self._handle_button(name)
+
+    def _handle_button(self, name: str):
+        seq = self.seq
+        set_led = self.ui.set_led  # bound once; most branches toggle two LEDs
         try:
             if name == "REC":
                 if self.state != "RECORDING":
-                    self.seq.start_recording()
-                    self.ui.set_led("REC", True)
-                    self.ui.set_led("PLAY", False)
+                    seq.start_recording()
+                    set_led("REC", True)
+                    set_led("PLAY", False)
                     self.state = "RECORDING"
                 else:
-                    self.seq.stop_recording()
-                    self.ui.set_led("REC", False)
+                    seq.stop_recording()
+                    set_led("REC", False)
                     self.state = "IDLE"
 
             elif name == "PLAY":
                 if self.state != "PLAYING":
                     # Only allow play if there's something to play
-                    if self.seq.has_content():
-                        self.seq.start_playback(loop=True)
-                        self.ui.set_led("PLAY", True)
-                        self.ui.set_led("REC", False)
+                    if seq.has_content():
+                        seq.start_playback(loop=True)
+                        set_led("PLAY", True)
+                        set_led("REC", False)
                         self.state = "PLAYING"
                     else:
                         self._error_blink()
                 else:
-                    self.seq.stop_playback()
-                    self.ui.set_led("PLAY", False)
+                    seq.stop_playback()
+                    set_led("PLAY", False)
                     self.state = "IDLE"
 
             elif name == "STOP":
-                self.seq.stop_playback()
-                self.seq.stop_recording()
-                self.seq.panic_all_notes_off()
-                self.ui.set_led("PLAY", False)
-                self.ui.set_led("REC", False)
+                seq.stop_playback()
+                seq.stop_recording()
+                seq.panic_all_notes_off()
+                set_led("PLAY", False)
+                set_led("REC", False)
                 self.state = "IDLE"
 
             elif name == "SAVE":
                 # Ask sequencer for events snapshot
-                events_rows = self.seq.export_events_rows()
+                events_rows = seq.export_events_rows()
                 if not events_rows:
                     self._error_blink()
                 else:
-                    meta = {"bpm": self.seq.get_bpm(), "channels": self.seq.get_channels()}
+                    meta = {"bpm": seq.get_bpm(), "channels": seq.get_channels()}
                     self.store.save(self._current_pattern_name, meta, events_rows)
                     self.ui.flash("SAVE", times=2)
 
@@ -101,7 +122,7 @@ class Controller:
                 else:
                     # For Sprint 1: just load the first name (round-robin later)
                     meta, rows = self.store.load(names[0])
-                    self.seq.import_events_rows(rows)
+                    seq.import_events_rows(rows)
                     self._current_pattern_name = names[0]
                     self.ui.flash("LOAD", times=2)
 
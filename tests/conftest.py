@@ -0,0 +1,36 @@
+# tests/conftest.py
+# Shared pytest setup: src/ on sys.path and no real sleeping anywhere in the suite.
+import os, sys, time
+
+import pytest
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from tests.vclock import VirtualClock
+
+
+def pytest_addoption(parser):
+    parser.addoption("--storage-backend", choices=("memory", "disk"), default="memory",
+                     help="backend for the `storage` fixture (disk = DefaultStorage in tmp_path)")
+
+
+@pytest.fixture(autouse=True)
+def vclock(monkeypatch):
+    """time.sleep / time.sleep_ms advance a virtual clock instead of blocking."""
+    clock = VirtualClock()
+    monkeypatch.setattr(time, "sleep", clock.advance)
+    monkeypatch.setattr(time, "sleep_ms", clock.advance_ms, raising=False)
+    return clock
+
+
+@pytest.fixture(scope="module")
+def storage(request, tmp_path_factory):
+    """JSON storage for integration tests: in-memory by default, real files with --storage-backend=disk.
+    One instance per test module, so a module's tests can share what an earlier fixture saved."""
+    if request.config.getoption("--storage-backend") == "disk":
+        from integration.audio_storage_bridge import DefaultStorage
+        return DefaultStorage(str(tmp_path_factory.mktemp("storage")))
+    from tests.fakes.mem_store import MemoryStorage
+    return MemoryStorage()
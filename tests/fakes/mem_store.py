@@ -0,0 +1,21 @@
+# tests/fakes/mem_store.py
+# In-memory stand-in for integration.audio_storage_bridge.DefaultStorage (no filesystem IO).
+import json
+
+
+class MemoryStorage:
+    """Same save/load interface as DefaultStorage, backed by a dict of JSON bytes."""
+
+    def __init__(self):
+        self.blobs: dict[str, bytes] = {}
+
+    def save_json(self, name: str, data: dict) -> None:
+        self.blobs[name] = json.dumps(data).encode("utf-8")
+
+    def save_json_stream(self, name: str, chunks) -> None:
+        self.blobs[name] = "".join(chunks).encode("utf-8")
+
+    def load_json(self, name: str) -> dict:
+        if name not in self.blobs:
+            raise FileNotFoundError(name)
+        return json.loads(self.blobs[name])
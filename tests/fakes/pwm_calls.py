@@ -0,0 +1,7 @@
+# tests/fakes/pwm_calls.py
+# Helpers for reading the ("freq"/"duty", value) call log kept by fake PWM objects.
+
+
+def first_freq(calls, start=0):
+    """First frequency written at or after calls[start], or None (stops at the match)."""
+    return next((v for n, v in calls[start:] if n == "freq"), None)
@@ -2,6 +2,8 @@
 
 import os, sys, types
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from tests.fakes.pwm_calls import first_freq
 
 # ---- Fake MicroPython 'machine' API ----
 class _ADC:
@@ -34,15 +36,13 @@ sys.modules['machine'] = fake_machine
 import config.pins as p
 from hal import adc_reader, pwm_audio
 
-# Avoid sleeping in tests
-pwm_audio.time.sleep_ms = lambda ms: None  # monkeypatch
-
 # ---- Test ADCReader behavior ----
+_EXPECTED_NORM = 2500 / 65535  # precomputed; not read from the driver
 adc = adc_reader.ADCReader(samples=4)
 raw = adc.read_raw()  # avg of [1000,2000,3000,4000] = 2500
 norm = adc.read_norm()
 assert raw == 2500, f"expected 2500, got {raw}"
-assert 0.0 < norm < 1.0 and abs(norm - (2500/65535)) < 1e-6
+assert 0.0 < norm < 1.0 and abs(norm - _EXPECTED_NORM) < 1e-9
 print("OK - ADCReader avg & norm:", raw, round(norm, 6))
 
 # ---- Test PWMAudio call order & clamping ----
@@ -51,16 +51,16 @@ bz = pwm_audio.PWMAudio()
 # record starting length (constructor already did a 'duty->0' to mute)
 start = len(bz._pwm.calls)
 
-bz.play_tone(440, 5, 0.5)  # short duration; sleep is patched
+bz.emit_tone(440, 0.5)  # same writes as play_tone, no sleep
 
 # We expect, within this call: duty->0, freq->≈440, duty->~32767, ... final duty->0
 slice_calls = bz._pwm.calls[start:start+3]
 names = [name for name, _ in slice_calls]
-assert names == ["duty", "freq", "duty"], f"bad order inside play_tone: {names}"
+assert names == ["duty", "freq", "duty"], f"bad order inside emit_tone: {names}"
 
 # frequency should have been set to ~440 Hz
-freq_vals = [val for name, val in slice_calls if name == "freq"]
-assert freq_vals and abs(freq_vals[0] - 440) <= 1, f"freq not ~440: {freq_vals}"
+freq = first_freq(slice_calls)
+assert freq is not None and abs(freq - 440) <= 1, f"freq not ~440: {freq}"
 
 # final call overall should end with duty->0 (clean stop)
 last_name, last_val = bz._pwm.calls[-1]
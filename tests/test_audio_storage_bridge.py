@@ -0,0 +1,25 @@
+# tests/test_audio_storage_bridge.py
+# save_sequence/load_sequence through the conftest `storage` fixture (memory or --storage-backend=disk).
+import pytest
+
+from integration.audio_storage_bridge import save_sequence, load_sequence
+
+SEQ = [
+    {"pitch": 60, "velocity": 0.6, "duration_ms": 120},
+    {"pitch": 64, "velocity": 1 / 3, "duration_ms": 90},   # repr needs all 17 digits
+    {"pitch": 67, "velocity": 1e-7, "duration_ms": 160},   # exponent form
+]
+
+
+def test_sequence_stream_round_trip(storage):
+    assert hasattr(storage, "save_json_stream")  # the streaming path is under test
+    save_sequence(storage, "rt_seq", SEQ)
+    assert load_sequence(storage, "rt_seq") == SEQ
+
+
+@pytest.mark.parametrize("bad", [float("nan"), float("inf"), float("-inf")])
+def test_non_finite_velocity_is_rejected(storage, bad):
+    save_sequence(storage, "rt_keep", SEQ)
+    with pytest.raises(ValueError):
+        save_sequence(storage, "rt_keep", SEQ[:1] + [{"pitch": 62, "velocity": bad}])
+    assert load_sequence(storage, "rt_keep") == SEQ  # previous file still loads
@@ -2,7 +2,7 @@
 # Tests your original ui/controller.py with your own mocks and storage.
 # No dependency on the teammate's sequencer.
 
-import os, sys, time
+import os, sys
 
 # --- Make project root importable when running from /tests ---
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -11,6 +11,7 @@ from ui.controller import Controller, DEBOUNCE_MS
 from storage.pattern_io import PatternStore
 from mocks.mock_hal_ui import MockUI
 from mocks.mock_sequencer import MockSequencer
+from tests.vclock import VirtualClock
 
 TEST_DIR = "./patterns_controller_initial"
 
@@ -29,14 +30,31 @@ def assert_in_log(ui, entry, msg):
     if entry not in ui.log:
         raise AssertionError(f"{msg}\nExpected entry {entry} in ui.log, got:\n{ui.log}")
 
-def run_tests():
+def test_controller_initial(vclock):
+    run_tests(vclock)
+
+def test_queue_overflow_drops_newest(vclock):
+    from ui.controller import QUEUE_LEN
+    ui = MockUI()
+    ctl = Controller(MockSequencer(), PatternStore(TEST_DIR), ui, clock=vclock.now_ms)
+    for _ in range(QUEUE_LEN):
+        assert ctl.enqueue_button("NOOP") is True  # unknown name: handled as a no-op
+    assert ctl.enqueue_button("REC") is False, "press past QUEUE_LEN should be dropped"
+    while ctl._queue:
+        ctl.poll()
+    assert ui.led["REC"] is False, "dropped REC press must not be handled"
+    _clean_dir(TEST_DIR)
+
+def run_tests(clock=None):
+    # Button timestamps come from a virtual clock, so waiting out DEBOUNCE_MS is instant
+    clock = clock or VirtualClock()
     print("== Controller (initial) focused tests ==")
     _clean_dir(TEST_DIR)
 
     ui = MockUI()
     store = PatternStore(TEST_DIR)
     seq = MockSequencer()
-    ctl = Controller(seq, store, ui)
+    ctl = Controller(seq, store, ui, clock=clock.now_ms)
 
     # --- 1) PLAY with no content -> ERR blink
     ctl.enqueue_button("PLAY")
@@ -47,7 +65,7 @@ def run_tests():
     ctl.enqueue_button("REC"); ctl.poll()   # start recording
     assert ui.led["REC"] is True, "REC LED should be ON after first REC press"
 
-    time.sleep((DEBOUNCE_MS + 10) / 1000.0)  # ensure next REC isn't debounced
+    clock.advance_ms(DEBOUNCE_MS + 10)  # ensure next REC isn't debounced
     ctl.enqueue_button("REC"); ctl.poll()    # stop recording
     assert ui.led["REC"] is False, "REC LED should be OFF after second REC press"
 
@@ -59,7 +77,7 @@ def run_tests():
     seq.inject_dummy_events(n=3)
 
     # 👇 This wait is the critical fix: avoid SAVE debouncing
-    time.sleep((DEBOUNCE_MS + 10) / 1000.0)
+    clock.advance_ms(DEBOUNCE_MS + 10)
 
     ctl.enqueue_button("SAVE"); ctl.poll()
     assert_in_log(ui, ("LED", "SAVE", True), "SAVE should flash SAVE LED")
@@ -79,7 +97,7 @@ def run_tests():
 
     # --- 7) Debounce check: rapid duplicate press is ignored
     ctl.enqueue_button("REC"); ctl.poll()  # turn REC on
-    ctl._last_press_ms["REC"] = ctl._last_press_ms["REC"] + DEBOUNCE_MS - 5
+    clock.advance_ms(DEBOUNCE_MS - 5)
     ctl.enqueue_button("REC"); ctl.poll()
     assert ui.led["REC"] is True, "Second REC within debounce should be ignored (LED stays ON)"
 
@@ -1,15 +1,30 @@
 # tests/test_hal_guard.py
-import os, sys, unittest
+import os, sys, importlib, unittest
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
+_MODS = ("machine", "hal.adc_reader", "hal.pwm_audio")
+
 class TestHalGuards(unittest.TestCase):
+    def setUp(self):
+        # src/machine.py (desktop shim) would satisfy the HAL's import guard:
+        # hide it so the HAL imports as it does on a plain laptop Python
+        self._saved = {m: sys.modules.pop(m, None) for m in _MODS}
+        sys.modules["machine"] = None  # `import machine` -> ImportError
+
+    def tearDown(self):
+        for m, mod in self._saved.items():
+            if mod is None:
+                sys.modules.pop(m, None)
+            else:
+                sys.modules[m] = mod
+
     def test_adcreader_refuses_on_laptop(self):
-        from hal.adc_reader import ADCReader
+        ADCReader = importlib.import_module("hal.adc_reader").ADCReader
         with self.assertRaises(RuntimeError):
             ADCReader()
 
     def test_pwmaudio_refuses_on_laptop(self):
-        from hal.pwm_audio import PWMAudio
+        PWMAudio = importlib.import_module("hal.pwm_audio").PWMAudio
         with self.assertRaises(RuntimeError):
             PWMAudio()
 
@@ -1,6 +1,12 @@
 # tests/test_hal_with_fakes.py
-import os, sys, types, importlib, unittest
+import os, sys, types, importlib
+import pytest
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from tests.fakes.pwm_calls import first_freq
+import config.pins as p
+
+_EXPECTED_NORM = 2500 / 65535  # avg of the fake ADC's 1000..4000 samples, normalized
 
 # --- Fake MicroPython 'machine' API ---
 class _ADC:
@@ -23,62 +29,66 @@ class _PWM:
     def freq(self, hz: int): self.calls.append(("freq", int(hz)))
     def duty_u16(self, duty: int): self.calls.append(("duty", int(duty)))
 
-class HalWithFakesTest(unittest.TestCase):
-    def setUp(self):
-        # Save any real 'machine' and inject fake
-        self._old_machine = sys.modules.get("machine")
-        sys.modules["machine"] = types.SimpleNamespace(ADC=_ADC, Pin=_Pin, PWM=_PWM)
-
-        # Ensure fresh imports of HAL after injecting fake
-        for mod in ("hal.adc_reader", "hal.pwm_audio"):
-            if mod in sys.modules: del sys.modules[mod]
-        self.adc_reader = importlib.import_module("hal.adc_reader")
-        self.pwm_audio  = importlib.import_module("hal.pwm_audio")
-
-        # Avoid real sleeps
-        self.pwm_audio.time.sleep_ms = lambda ms: None
+@pytest.fixture(scope="module")
+def hal():
+    # Save any real 'machine' and inject fake
+    old_machine = sys.modules.get("machine")
+    sys.modules["machine"] = types.SimpleNamespace(ADC=_ADC, Pin=_Pin, PWM=_PWM)
 
-    def tearDown(self):
-        # Restore previous 'machine'
-        if self._old_machine is None:
-            sys.modules.pop("machine", None)
-        else:
-            sys.modules["machine"] = self._old_machine
+    # Import HAL once against the fake; each test builds fresh ADCReader/PWMAudio
+    # objects, and _PWM.calls is per-instance, so nothing leaks between tests
+    for mod in ("hal.adc_reader", "hal.pwm_audio"):
+        if mod in sys.modules: del sys.modules[mod]
+    ns = types.SimpleNamespace(adc_reader=importlib.import_module("hal.adc_reader"),
+                               pwm_audio=importlib.import_module("hal.pwm_audio"))
+    ns.pwm_audio._SLEEP_SCALE = 0.0  # tone durations -> sleep_ms(0)
+    yield ns
 
-    def test_adcreader_avg_and_norm(self):
-        adc = self.adc_reader.ADCReader(samples=4)
-        raw = adc.read_raw()   # avg of 1000,2000,3000,4000 = 2500
-        self.assertEqual(raw, 2500)
-        self.assertAlmostEqual(adc.read_norm(), 2500/65535.0, places=6)
+    ns.pwm_audio._SLEEP_SCALE = 1.0
+    # Restore previous 'machine'
+    if old_machine is None:
+        sys.modules.pop("machine", None)
+    else:
+        sys.modules["machine"] = old_machine
 
-    def test_pwmaudio_order_and_stop(self):
-        bz = self.pwm_audio.PWMAudio()
-        start = len(bz._pwm.calls)  # constructor adds a duty->0
-        bz.play_tone(440, 5, 0.5)
-        calls = bz._pwm.calls[start:start+3]
-        names = [n for n, _ in calls]
-        self.assertEqual(names, ["duty", "freq", "duty"])  # pop-safe start
-        # freq ~ 440
-        freq_vals = [v for n, v in calls if n == "freq"]
-        self.assertTrue(freq_vals and abs(freq_vals[0] - 440) <= 1)
-        # final stop is duty->0
-        self.assertEqual(bz._pwm.calls[-1], ("duty", 0))
+def test_adcreader_avg_and_norm(hal):
+    adc = hal.adc_reader.ADCReader(samples=4)
+    raw = adc.read_raw()   # avg of 1000,2000,3000,4000 = 2500
+    assert raw == 2500
+    assert adc.read_norm() == pytest.approx(_EXPECTED_NORM)
 
-    def test_pwmaudio_clamps_frequency(self):
-        import config.pins as p
-        bz = self.pwm_audio.PWMAudio()
-        start = len(bz._pwm.calls)
+def test_pwmaudio_order_and_stop(hal):
+    bz = hal.pwm_audio.PWMAudio()
+    start = len(bz._pwm.calls)  # constructor adds a duty->0
+    bz.emit_tone(440, 0.5)
+    calls = bz._pwm.calls[start:start+3]
+    assert [n for n, _ in calls] == ["duty", "freq", "duty"]  # pop-safe start
+    # freq ~ 440
+    freq = first_freq(calls)
+    assert freq is not None and abs(freq - 440) <= 1
+    # final stop is duty->0
+    assert bz._pwm.calls[-1] == ("duty", 0)
 
-        # too-low freq -> clamp to MIN_TONE_HZ
-        bz.play_tone(p.MIN_TONE_HZ / 10.0, 1, 0.1)
-        low_freq = [v for n, v in bz._pwm.calls[start:] if n == "freq"][0]
-        self.assertEqual(low_freq, int(p.MIN_TONE_HZ))
+@pytest.mark.parametrize("freq_in, expected", [
+    (p.MIN_TONE_HZ / 10.0, int(p.MIN_TONE_HZ)),  # too low -> MIN_TONE_HZ
+    (p.MAX_TONE_HZ * 10.0, int(p.MAX_TONE_HZ)),  # too high -> MAX_TONE_HZ
+])
+def test_pwmaudio_clamps_frequency(hal, freq_in, expected):
+    bz = hal.pwm_audio.PWMAudio()
+    bz.emit_tone(freq_in, 0.1)
+    assert first_freq(bz._pwm.calls) == expected
 
-        # clear and test high clamp
-        bz._pwm.calls.clear()
-        bz.play_tone(p.MAX_TONE_HZ * 10.0, 1, 0.1)
-        high_freq = [v for n, v in bz._pwm.calls if n == "freq"][0]
-        self.assertEqual(high_freq, int(p.MAX_TONE_HZ))
+def test_pwmaudio_play_tones_batch(hal):
+    bz = hal.pwm_audio.PWMAudio()
+    start = len(bz._pwm.calls)
+    bz.play_tones([(440, 5, 0.5), (0, 5, 0.5), (p.MAX_TONE_HZ * 10.0, 5, 2.0)])
+    calls = bz._pwm.calls[start:]
+    # two valid tones, each pop-safe: duty0, freq, duty, duty0 (+ final stop)
+    assert [n for n, _ in calls[:8]] == ["duty", "freq", "duty", "duty"] * 2
+    assert calls[1] == ("freq", 440)
+    assert calls[5] == ("freq", int(p.MAX_TONE_HZ))
+    assert calls[6] == ("duty", 65535)  # volume clamped to 1.0
+    assert calls[-1] == ("duty", 0)
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,147 @@
+# tests/test_sequencer.py
+# core.sequencer on a virtual clock: recording, quantize, looped playback, storage rows.
+import random
+
+import pytest
+
+import core.sequencer as sq
+from core.sequencer import Sequencer
+from mocks.mock_sequencer import MockSequencer
+from models.types import NoteEvent
+
+
+@pytest.fixture
+def clock(vclock, monkeypatch):
+    """Drive the sequencer's ticks_ms from the shared virtual clock."""
+    monkeypatch.setattr(sq, "ticks_ms", vclock.now_ms)
+    return vclock
+
+
+def _record(seq, clock, stamps, pitch0=60):
+    """Record one event per (relative) timestamp, advancing the clock between them."""
+    seq.start_recording()
+    t0 = clock.now_ms()
+    for k, t in enumerate(stamps):
+        clock.advance_ms(t0 + t - clock.now_ms())
+        seq.record_event(NoteEvent(0, 0, 0.5, pitch0 + k))
+
+
+def _columns(seq):
+    return list(seq._t), list(seq._ch), list(seq._pitch), list(seq._mag), list(seq._dur)
+
+
+def test_record_stop_loops_over_whole_bars(clock):
+    seq = Sequencer(bpm=120)  # 2000 ms bars
+    _record(seq, clock, [100, 700, 2500])
+    seq.stop_recording()
+    assert [r[0] for r in seq.export_events_rows()] == [100, 700, 2500]
+    assert seq.summary()["track_len_ms"] == 4000
+
+    seq.start_playback(loop=True)
+    t0 = clock.now_ms()
+    heard = []
+    for dt in range(10, 8010, 10):  # two full loops
+        heard += [(dt, e.pitch) for e in seq.tick(t0 + dt)]
+    assert heard == [(100, 60), (700, 61), (2500, 62),
+                     (4100, 60), (4700, 61), (6500, 62)]
+
+
+def test_quantize_snaps_to_grid_and_keeps_order(clock):
+    seq = Sequencer(quantize_ms=100)
+    _record(seq, clock, [0, 149, 160, 240, 260])
+    # 160 and 240 share the 200 slot and keep their recording order
+    assert [(t, p) for t, _, p, _, _ in zip(*_columns(seq))] == \
+        [(0, 60), (100, 61), (200, 62), (200, 63), (300, 64)]
+
+
+def test_record_events_matches_record_event(clock):
+    chord = [NoteEvent(0, 0, 0.5, p) for p in (60, 64, 67)]
+    a, b = Sequencer(quantize_ms=100), Sequencer(quantize_ms=100)
+    for seq, batched in ((a, True), (b, False)):
+        clock.advance_ms(1000)
+        seq.start_recording()
+        t0 = clock.now_ms()
+        for rel in (120, 480):
+            clock.advance_ms(t0 + rel - clock.now_ms())
+            seq.record_event(NoteEvent(0, 0, 0.9, 40 + rel // 100))
+        # step the clock back so the chord (260 -> 300) is spliced in before the 500 slot
+        clock.advance_ms(t0 + 260 - clock.now_ms())
+        if batched:
+            seq.record_events(chord)
+        else:
+            for e in chord:
+                seq.record_event(e)
+    assert _columns(a) == _columns(b)
+    assert [p for p in a._pitch] == [41, 60, 64, 67, 44]
+
+
+def test_export_import_round_trip():
+    rows = [[0, 0, 0.5, 60, None], [250, 1, 0.25, None, 120], [250, 0, 1.0, 127, 0]]
+    seq = Sequencer()
+    seq.import_events_rows(rows)
+    assert seq.export_events_rows() == rows
+    assert seq.has_content() and seq.summary()["track_len_ms"] == 250
+
+
+def test_bad_event_leaves_columns_aligned(clock):
+    seq = Sequencer()
+    _record(seq, clock, [0, 100])
+    for bad in (NoteEvent(0, 0, 0.5, 300), NoteEvent(0, 0, 0.5, 60, -5), NoteEvent(999, 0, 0.5)):
+        with pytest.raises(ValueError):
+            seq.record_event(bad)
+        with pytest.raises(ValueError):
+            seq.record_events([NoteEvent(0, 0, 0.5, 61), bad])
+        assert {len(c) for c in _columns(seq)} == {2}
+
+
+def _reference_heard(stamps, track_len, tick_times, t0):
+    """Unrolled-time model of looped playback: each loop k plays t at k*track_len + t."""
+    heard, prev = [], 0
+    for now in tick_times:
+        cur = now - t0
+        due = []
+        for k in range(prev // track_len, cur // track_len + 1):
+            for idx, t in enumerate(stamps):
+                at = k * track_len + t
+                if prev < at <= cur:
+                    due.append((at, k, idx))
+        heard += [(now, idx) for _, _, idx in sorted(due)]
+        prev = cur
+    return heard
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_looped_playback_matches_reference_model(clock, seed):
+    rnd = random.Random(seed)
+    stamps = sorted(rnd.randrange(0, 6000) for _ in range(rnd.randrange(1, 25)))
+    seq = Sequencer(bpm=rnd.choice((60, 90, 120, 150)))
+    _record(seq, clock, stamps, pitch0=0)
+    seq.stop_recording()
+    track_len = seq.summary()["track_len_ms"]
+
+    seq.start_playback(loop=True)
+    t0 = clock.now_ms()
+    now, tick_times = t0, []
+    while now - t0 < 3 * track_len:
+        now += rnd.randrange(1, min(track_len, 400))  # at most one wrap per tick
+        tick_times.append(now)
+    heard = [(now, e.pitch) for now in tick_times for e in seq.tick(now)]
+    assert heard == _reference_heard(stamps, track_len, tick_times, t0)
+
+
+@pytest.mark.parametrize("make", [Sequencer, MockSequencer])
+def test_import_rejects_bad_row_atomically(make):
+    seq = make()
+    seq.import_events_rows([[0, 0, 0.5, 60, None]])
+    with pytest.raises(ValueError):
+        seq.import_events_rows([[0, 0, 0.5, 60, None], [100, 0, 0.5, 300, None]])
+    # the previous take survives and every column still has one row per event
+    assert {len(c) for c in _columns(seq)} == {1}
+    assert seq.export_events_rows() == [[0, 0, 0.5, 60, None]]
+
+
+@pytest.mark.parametrize("make", [Sequencer, MockSequencer])
+def test_import_coerces_json_floats(make):
+    seq = make()
+    seq.import_events_rows([[0.0, 0, 0.5, 60.0, 120.0], [250.0, 1.0, 1, None, None]])
+    assert seq.export_events_rows() == [[0, 0, 0.5, 60, 120], [250, 1, 1.0, None, None]]
@@ -5,18 +5,21 @@ from models.types import NoteEvent
 
 TEST_DIR = "./patterns_test"
 
-def _clean():
+def _clean(path=TEST_DIR):
     try:
-        for f in os.listdir(TEST_DIR):
-            os.remove(TEST_DIR + "/" + f)
-        os.rmdir(TEST_DIR)
+        for f in os.listdir(path):
+            os.remove(path + "/" + f)
+        os.rmdir(path)
     except Exception:
         pass
 
-def run_tests():
+def test_storage(tmp_path):
+    run_tests(str(tmp_path / "patterns_test"))
+
+def run_tests(base_dir=TEST_DIR):
     print("== Storage tests ==")
-    _clean()
-    store = PatternStore(TEST_DIR)
+    _clean(base_dir)
+    store = PatternStore(base_dir)
 
     # 1. Sunny save+load
     events = [NoteEvent(0, i*100, 0.9, 60+i).to_row() for i in range(5)]
@@ -42,6 +45,7 @@ def run_tests():
         assert False, "Expected IOError for corrupt"
     except IOError:
         pass
+    store.delete("corrupt")  # still a *.json, so list_patterns() would report it
 
     # 4. Delete + list
     store.save("another", {"bpm": 90, "channels": 1}, events[:2])
@@ -50,7 +54,7 @@ def run_tests():
     assert store.list_patterns() == ["My_Song_1"]
 
     print("All storage tests passed.")
-    _clean()
+    _clean(base_dir)
 
 if __name__ == "__main__":
     run_tests()
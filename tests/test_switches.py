@@ -0,0 +1,85 @@
+# tests/test_switches.py
+# SwitchController edge-IRQ path against a fake Pin that fires its handler on every level change.
+import pytest
+
+from _time_shim import install
+install()  # audio.switches binds time.ticks_ms at import
+
+import audio.switches as switches
+from audio.switches import SwitchController
+
+
+class FakePin:
+    IN = 0
+    PULL_UP = 1
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, num, mode=None, pull=None):
+        self.num = num
+        self.level = 1  # pull-up: released
+        self.reads = 0
+        self.handler = None
+
+    def value(self):
+        self.reads += 1
+        return self.level
+
+    def irq(self, trigger=0, handler=None, hard=False):
+        self.handler = handler
+
+    def set(self, level):
+        if level != self.level:
+            self.level = level
+            if self.handler:
+                self.handler(self)
+
+
+@pytest.fixture
+def make(monkeypatch):
+    monkeypatch.setattr(switches, "Pin", FakePin)
+    return lambda **kw: SwitchController([16, 17], debounce_ms=50, **kw)
+
+
+def _run(sc, script, until_ms=2000, step_ms=10):
+    """Apply {t: (pin_index, level)} edits while updating every step; collect events."""
+    log = []
+    for t in range(0, until_ms, step_ms):
+        for i, level in script.get(t, ()):
+            sc._pins[i].set(level)
+        sc.update_packed(_ticks=lambda: t)
+        ev = sc.get_events()
+        if ev["pressed"] or ev["released"]:
+            log.append((t, ev["pressed"], ev["released"]))
+        if ev["held"]:
+            log.append((t, "held", ev["held"]))
+    return log
+
+
+# sw_1 bounces then holds past the hold threshold; sw_2 taps once
+SCRIPT = {
+    100: [(0, 0)], 110: [(0, 1)], 120: [(0, 0)],
+    300: [(1, 0)], 400: [(1, 1)],
+    1500: [(0, 1)],
+}
+
+
+def test_irq_path_matches_polling(make):
+    irq, poll = make(irq=True), make(irq=False)
+    assert irq._irq and not poll._irq
+    log = _run(irq, SCRIPT)
+    assert log == _run(poll, SCRIPT)
+    assert (170, ["sw_1"], []) in log and (1170, "held", ["sw_1"]) in log
+
+
+def test_idle_updates_skip_pin_reads(make):
+    sc = make(irq=True)
+    reads = lambda: sum(p.reads for p in sc._pins)  # noqa: E731
+    base = reads()
+    for t in range(0, 500, 10):
+        sc.update_packed(_ticks=lambda: t)
+    assert reads() == base  # no edges: no GPIO reads at all
+
+    sc._pins[0].set(0)  # ISR sets the pending bit
+    sc.update_packed(_ticks=lambda: 500)
+    assert reads() > base
@@ -0,0 +1,9 @@
+# tests/test_types.py
+from models.types import NoteEvent
+
+
+def test_from_row_coerces_json_values():
+    # rows loaded from disk may carry floats/strings; from_row normalizes them
+    e = NoteEvent.from_row([100.0, "1", "0.5", 60.0, None])
+    assert (e.timestamp_ms, e.channel, e.magnitude, e.pitch, e.duration_ms) == (100, 1, 0.5, 60, None)
+    assert type(e.timestamp_ms) is int and type(e.pitch) is int
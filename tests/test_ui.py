@@ -1,27 +1,35 @@
 # tests/test_ui.py
-from ui.controller import Controller
+import os, sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ui.controller import Controller, DEBOUNCE_MS
 from storage.pattern_io import PatternStore
 from mocks.mock_hal_ui import MockUI
 from mocks.mock_sequencer import MockSequencer
-import os
+from tests.vclock import VirtualClock
 
 TEST_DIR = "./patterns_test_ui"
 
-def _clean():
+def _clean(path=TEST_DIR):
     try:
-        for f in os.listdir(TEST_DIR):
-            os.remove(TEST_DIR + "/" + f)
-        os.rmdir(TEST_DIR)
+        for f in os.listdir(path):
+            os.remove(path + "/" + f)
+        os.rmdir(path)
     except Exception:
         pass
 
-def run_tests():
+def test_ui(tmp_path, vclock):
+    run_tests(str(tmp_path / "patterns_test_ui"), vclock)
+
+def run_tests(base_dir=TEST_DIR, clock=None):
+    # Button timestamps come from a virtual clock, so waiting out DEBOUNCE_MS is instant
+    clock = clock or VirtualClock()
     print("== UI tests ==")
-    _clean()
+    _clean(base_dir)
     ui = MockUI()
-    store = PatternStore(TEST_DIR)
+    store = PatternStore(base_dir)
     seq = MockSequencer()
-    ctl = Controller(seq, store, ui)
+    ctl = Controller(seq, store, ui, clock=clock.now_ms)
 
     # PLAY with no content -> error blink
     ctl.enqueue_button("PLAY")
@@ -32,6 +40,7 @@ def run_tests():
     ctl.enqueue_button("REC")
     ctl.poll()
     assert ui.led["REC"] is True
+    clock.advance_ms(DEBOUNCE_MS + 10)  # second REC (and PLAY below) past debounce
     ctl.enqueue_button("REC")
     ctl.poll()
     assert ui.led["REC"] is False
@@ -56,7 +65,7 @@ def run_tests():
     assert ui.led["PLAY"] is False and ui.led["REC"] is False
 
     print("All UI tests passed.")
-    _clean()
+    _clean(base_dir)
 
 if __name__ == "__main__":
     run_tests()
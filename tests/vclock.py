@@ -0,0 +1,18 @@
+# tests/vclock.py
+# Virtual clock for laptop tests: "sleeping" advances it instantly instead of blocking.
+
+class VirtualClock:
+    def __init__(self, start_ms: int = 1_000_000):
+        # Non-zero start so first presses aren't inside DEBOUNCE_MS of t=0
+        self._ms = start_ms
+
+    def now_ms(self) -> int:
+        return int(self._ms)
+
+    def advance(self, seconds: float) -> None:
+        """Drop-in for time.sleep()."""
+        self._ms += seconds * 1000
+
+    def advance_ms(self, ms: int) -> None:
+        """Drop-in for MicroPython's time.sleep_ms()."""
+        self._ms += ms